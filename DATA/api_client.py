@@ -0,0 +1,282 @@
+"""
+Shared HTTP client for the API-Football fetch scripts.
+
+All requests go through one pooled requests.Session and are spaced by a token
+bucket that follows the account's quota: it starts at REQUESTS_PER_MINUTE and
+adopts the per-minute limit and remaining count from each response's
+rate-limit headers. Connection errors, timeouts, 429/5xx responses and
+rate-limit error payloads are retried with exponential backoff; an exhausted
+daily quota raises QuotaExceeded straight away.
+
+map() runs independent requests on a thread pool, and get_all_pages() fetches
+the remaining pages of a paged endpoint concurrently once the first page has
+reported how many there are. Set API_FOOTBALL_BASE_URL to point the scripts at
+another server, e.g. the stub in benchmarks/bench_fetch_players.py.
+
+With a ResponseCache, successful responses are kept on disk - one file per
+request, named by the hash of its full URL including the server - and reused until their endpoint's TTL
+runs out. checkpoint() stores processed results (e.g. one team's players) the
+same way, so an interrupted refresh resumes where it stopped.
+"""
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.environ.get("API_FOOTBALL_BASE_URL", "https://v3.football.api-sports.io")
+
+# Starting rate (the free plan's); raised or lowered by the X-RateLimit-Limit header
+REQUESTS_PER_MINUTE = int(os.environ.get("API_FOOTBALL_REQUESTS_PER_MINUTE", 10))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+CACHE_DIR = os.environ.get("API_FOOTBALL_CACHE_DIR", os.path.join("DATA", ".api_cache"))
+
+# Seconds a cached response stays fresh, per endpoint (checkpoints use their own name)
+HOUR, DAY = 3600, 86400
+ENDPOINT_TTLS = {
+    "fixtures": HOUR,
+    "players": 7 * DAY,
+    "top_players": 7 * DAY,
+    "teams": 30 * DAY,
+    "leagues": 30 * DAY,
+}
+DEFAULT_TTL = DAY
+
+
+class ApiError(Exception):
+    pass
+
+
+class QuotaExceeded(ApiError):
+    """The account's daily request quota is used up; retrying will not help."""
+
+
+class TokenBucket:
+    """Blocking rate limiter allowing bursts of up to `capacity` requests."""
+
+    def __init__(self, requests_per_minute, capacity=None):
+        self._lock = threading.Lock()
+        self._rate = requests_per_minute / 60
+        self._capacity = capacity or requests_per_minute
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def set_rate(self, requests_per_minute):
+        with self._lock:
+            self._refill()
+            self._rate = requests_per_minute / 60
+            self._capacity = requests_per_minute
+            self._tokens = min(self._tokens, self._capacity)
+
+    def limit(self, remaining):
+        """Never hold more tokens than the server says are left in its window."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, remaining)
+
+
+class ResponseCache:
+    """
+    JSON payloads on disk, one file per request URL (named by its SHA-256), each
+    fresh for its endpoint's TTL. The URL includes the server, so responses from
+    a stub never stand in for the real API's. Writes are atomic, so a crash never leaves a
+    half-written entry. Set refresh to treat every entry as stale.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttls=None, refresh=False):
+        self.directory = directory
+        self.ttls = {**ENDPOINT_TTLS, **(ttls or {})}
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    @staticmethod
+    def url(base_url, endpoint, params):
+        return f"{base_url}/{endpoint}?{urlencode(sorted(params.items()))}"
+
+    def _path(self, url):
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], f"{digest}.json")
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def load(self, base_url, endpoint, params):
+        """The cached payload for the request, or None if it is missing or stale."""
+        url = self.url(base_url, endpoint, params)
+        try:
+            with open(self._path(url)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        age = time.time() - entry["fetched"]
+        if self.refresh or entry["url"] != url or age > self.ttls.get(endpoint, DEFAULT_TTL):
+            self._count("stale")
+            return None
+        self._count("hits")
+        return entry["payload"]
+
+    def store(self, base_url, endpoint, params, payload):
+        url = self.url(base_url, endpoint, params)
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"url": url, "fetched": time.time(), "payload": payload}, f)
+        os.replace(tmp, path)
+
+
+class ApiClient:
+    def __init__(self, api_key, base_url=BASE_URL, requests_per_minute=REQUESTS_PER_MINUTE,
+                 max_workers=8, retries=5, backoff=1.0, timeout=30, cache=None):
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.limiter = TokenBucket(requests_per_minute)
+
+        self.session = requests.Session()
+        self.session.headers["x-apisports-key"] = api_key
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2 * max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Separate pools so page fetches never wait behind the tasks that started them
+        self._tasks = ThreadPoolExecutor(max_workers, thread_name_prefix="api-task")
+        self._pages = ThreadPoolExecutor(max_workers, thread_name_prefix="api-page")
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._tasks.shutdown()
+        self._pages.shutdown()
+        self.session.close()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _observe(self, headers):
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        if limit and limit.isdigit() and int(limit) > 0:
+            self.limiter.set_rate(int(limit))
+        if remaining and remaining.isdigit():
+            self.limiter.limit(int(remaining))
+
+    def _delay(self, attempt, retry_after=None):
+        delay = self.backoff * 2 ** attempt * random.uniform(0.5, 1.0)
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        return delay
+
+    def get(self, endpoint, **params):
+        """Return the JSON payload of GET /endpoint?params, from the cache if fresh."""
+        if self.cache is not None:
+            payload = self.cache.load(self.base_url, endpoint, params)
+            if payload is not None:
+                return payload
+        payload = self._fetch(endpoint, params)
+        if self.cache is not None:
+            self.cache.store(self.base_url, endpoint, params, payload)
+        return payload
+
+    def checkpoint(self, name, params, compute):
+        """compute(), or its result from an earlier run while still fresh (TTL of `name`)."""
+        if self.cache is None:
+            return compute()
+        result = self.cache.load(self.base_url, name, params)
+        if result is None:
+            result = compute()
+            self.cache.store(self.base_url, name, params, result)
+        return result
+
+    def _fetch(self, endpoint, params):
+        # GET with retries; only successful payloads are returned
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(self.retries + 1):
+            self.limiter.acquire()
+            self._count("requests")
+            retry_after = None
+            try:
+                res = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = exc
+            else:
+                self._observe(res.headers)
+                if res.status_code == 200:
+                    payload = res.json()
+                    errors = payload.get("errors")
+                    if not errors:
+                        return payload
+                    if isinstance(errors, dict) and "requests" in errors:
+                        raise QuotaExceeded(errors["requests"])
+                    if not (isinstance(errors, dict) and "rateLimit" in errors):
+                        raise ApiError(f"{endpoint} {params}: {errors}")
+                    error = ApiError(f"{endpoint} {params}: {errors['rateLimit']}")
+                elif res.status_code in RETRY_STATUSES:
+                    error = ApiError(f"{endpoint} {params}: HTTP {res.status_code}")
+                    retry_after = res.headers.get("Retry-After")
+                else:
+                    raise ApiError(f"{endpoint} {params}: HTTP {res.status_code}")
+
+            if attempt < self.retries:
+                self._count("retries")
+                time.sleep(self._delay(attempt, retry_after))
+        raise error
+
+    def get_all_pages(self, endpoint, **params):
+        """Concatenated "response" items of every page of a paged endpoint."""
+        first = self.get(endpoint, **params, page=1)
+        items = list(first.get("response", []))
+        paging = first.get("paging")
+        if paging:
+            remaining = range(2, (paging.get("total") or 1) + 1)
+            for payload in self._pages.map(lambda page: self.get(endpoint, **params, page=page), remaining):
+                items.extend(payload.get("response", []))
+            return items
+
+        # No paging info: keep asking until a page comes back empty
+        page = 2
+        while True:
+            response = self.get(endpoint, **params, page=page).get("response", [])
+            if not response:
+                return items
+            items.extend(response)
+            page += 1
+
+    def map(self, fn, items):
+        """[fn(item) for item in items], run concurrently. fn must not call map() itself."""
+        return list(self._tasks.map(fn, items))
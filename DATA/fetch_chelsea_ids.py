@@ -1,38 +1,59 @@
+import argparse
+import os
+
 import requests
 
-API_KEY = ""  # Replace with your actual API key
+from api_client import ApiClient, ApiError, ResponseCache, CACHE_DIR
 
-headers = {
-    "x-apisports-key": API_KEY
-}
+API_KEY = os.environ.get("API_FOOTBALL_KEY", "")  # Replace with your actual API key
 
 # Specify the season
 season = 2023  # Replace with the desired season
 
 # Search for teams with "Chelsea" in the name
 query = "chelsea"
-teams_url = f"https://v3.football.api-sports.io/teams?search={query}"
 
-teams_response = requests.get(teams_url, headers=headers)
 
-if teams_response.status_code == 200:
-    teams = teams_response.json()["response"]
-    print(f"Found {len(teams)} team(s) matching '{query}':\n")
-    for team in teams:
+def team_leagues(client, team_id):
+    # Leagues of one team in the season, or the error that stopped the fetch
+    try:
+        return client.get("leagues", team=team_id, season=season)["response"], None
+    except (ApiError, requests.RequestException) as exc:
+        return None, exc
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List API-Football teams matching 'chelsea' and their leagues.")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="on-disk response cache")
+    parser.add_argument("--refresh", action="store_true", help="refetch, ignoring cached responses")
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.cache_dir, refresh=args.refresh)
+    with ApiClient(API_KEY, cache=cache) as client:
+        try:
+            teams = client.get("teams", search=query)["response"]
+        except (ApiError, requests.RequestException) as exc:
+            print(f"Failed to fetch teams: {exc}")
+            return
+
+        print(f"Found {len(teams)} team(s) matching '{query}':\n")
+        # Fetch leagues for every team concurrently, then report them in order
+        results = client.map(lambda team: team_leagues(client, team["team"]["id"]), teams)
+
+    for team, (leagues, error) in zip(teams, results):
         info = team["team"]
         team_id = info["id"]
         print(f"- {info['name']} (ID: {team_id})")
 
-        # Fetch leagues for the team in the given season
-        leagues_url = f"https://v3.football.api-sports.io/leagues?team={team_id}&season={season}"
-        leagues_response = requests.get(leagues_url, headers=headers)
-
-        if leagues_response.status_code == 200:
-            leagues = leagues_response.json()["response"]
+        if leagues is not None:
             league_names = [league["league"]["name"] for league in leagues]
             league_ids = [league["league"]["id"] for league in leagues]
             print(f"  Leagues in {season}: {', '.join(league_names)} (ID: {', '.join(map(str, league_ids))})")
         else:
-            print(f"  Failed to fetch leagues for team ID {team_id} in season {season}: {leagues_response.status_code}")
-else:
-    print(f"Failed to fetch teams: {teams_response.status_code}")
\ No newline at end of file
+            print(f"  Failed to fetch leagues for team ID {team_id} in season {season}: {error}")
+
+    print(f"Cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses, {cache.stats['stale']} stale")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
-import requests
+import argparse
 import json
+import os
 from datetime import datetime
 from dateutil.parser import isoparse
 
-API_KEY = ""  # Replace with your actual API key
+from api_client import ApiClient, ResponseCache, CACHE_DIR
+
+API_KEY = os.environ.get("API_FOOTBALL_KEY", "")  # Replace with your actual API key
 TEAM_ID = 49  # Chelsea FC
 
 # Determine correct football season year
@@ -11,35 +14,43 @@ now = datetime.now()
 SEASON = now.year - 1 if now.month < 7 else now.year
 LIMIT = 3
 
-headers = {
-    "x-apisports-key": API_KEY
-}
-
-# Fetch next fixtures for Chelsea
-url = f"https://v3.football.api-sports.io/fixtures?team={TEAM_ID}&season={SEASON}&next={LIMIT}"
-res = requests.get(url, headers=headers)
-data = res.json().get("response", [])
-
-# Process fixtures
-fixtures = []
-for f in data:
-    fixture_date = f["fixture"]["date"]
-    date = isoparse(fixture_date)
-    fixtures.append({
-        "date": date.strftime("%Y-%m-%d"),
-        "time": date.strftime("%H:%M"),
-        "opponent": (
-            f["teams"]["away"]["name"] if f["teams"]["home"]["id"] == TEAM_ID else f["teams"]["home"]["name"]
-        ),
-        "venue": "Home" if f["teams"]["home"]["id"] == TEAM_ID else "Away",
-        "competition": f["league"]["name"],
-        "logo": f["league"]["logo"],
-        "team_logo": f["teams"]["away"]["logo"] if f["teams"]["home"]["id"] == TEAM_ID else f["teams"]["home"]["logo"]
-    })
-
-# Save to JSON file
-output_path = "DATA/fixtures.json"
-with open(output_path, "w") as f:
-    json.dump(fixtures, f, indent=4)
-
-print(f"✅ Saved {len(fixtures)} fixtures to {output_path}")
\ No newline at end of file
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch Chelsea's next fixtures from API-Football.")
+    parser.add_argument("--output", default="DATA/fixtures.json")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="on-disk response cache")
+    parser.add_argument("--refresh", action="store_true", help="refetch, ignoring cached responses")
+    args = parser.parse_args()
+
+    # Fetch next fixtures for Chelsea (cached for an hour, see api_client.ENDPOINT_TTLS)
+    cache = ResponseCache(args.cache_dir, refresh=args.refresh)
+    with ApiClient(API_KEY, cache=cache) as client:
+        data = client.get("fixtures", team=TEAM_ID, season=SEASON, next=LIMIT).get("response", [])
+
+    # Process fixtures
+    fixtures = []
+    for f in data:
+        fixture_date = f["fixture"]["date"]
+        date = isoparse(fixture_date)
+        fixtures.append({
+            "date": date.strftime("%Y-%m-%d"),
+            "time": date.strftime("%H:%M"),
+            "opponent": (
+                f["teams"]["away"]["name"] if f["teams"]["home"]["id"] == TEAM_ID else f["teams"]["home"]["name"]
+            ),
+            "venue": "Home" if f["teams"]["home"]["id"] == TEAM_ID else "Away",
+            "competition": f["league"]["name"],
+            "logo": f["league"]["logo"],
+            "team_logo": f["teams"]["away"]["logo"] if f["teams"]["home"]["id"] == TEAM_ID else f["teams"]["home"]["logo"]
+        })
+
+    # Save to JSON file
+    with open(args.output, "w") as f:
+        json.dump(fixtures, f, indent=4)
+
+    print(f"✅ Saved {len(fixtures)} fixtures to {args.output}")
+    print(f"Cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses, {cache.stats['stale']} stale")
+
+
+if __name__ == "__main__":
+    main()
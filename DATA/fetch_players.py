@@ -1,14 +1,15 @@
-import requests
+import argparse
 import json
+import os
+import time
 from collections import defaultdict
-from time import sleep
 
-API_KEY = ""  # Replace with your actual API key
-SEASON = 2023
+import requests
 
-headers = {
-    "x-apisports-key": API_KEY
-}
+from api_client import ApiClient, ApiError, QuotaExceeded, ResponseCache, CACHE_DIR
+
+API_KEY = os.environ.get("API_FOOTBALL_KEY", "")  # Replace with your actual API key
+SEASON = 2023
 
 # Map squad names to their API-Football team IDs
 squad_team_ids = {
@@ -53,11 +54,9 @@ radar_fields = {
 
 
 # Get competitions a team participates in
-def get_team_leagues(team_id):
+def get_team_leagues(client, team_id):
     print(f"🔍 Fetching leagues for team ID {team_id}")
-    url = f"https://v3.football.api-sports.io/leagues?team={team_id}&season={SEASON}"
-    res = requests.get(url, headers=headers)
-    leagues = res.json().get("response", [])
+    leagues = client.get("leagues", team=team_id, season=SEASON).get("response", [])
     print(f"Found {len(leagues)} leagues for team ID {team_id}")
     return [
         {
@@ -69,11 +68,9 @@ def get_team_leagues(team_id):
     ]
 
 # Get all teams in a given competition
-def get_teams_in_league(league_id):
+def get_teams_in_league(client, league_id):
     print(f"📋 Fetching teams in league ID {league_id}")
-    url = f"https://v3.football.api-sports.io/teams?league={league_id}&season={SEASON}"
-    res = requests.get(url, headers=headers)
-    teams = res.json().get("response", [])
+    teams = client.get("teams", league=league_id, season=SEASON).get("response", [])
     return [
         {
             "team_id": t["team"]["id"],
@@ -82,23 +79,22 @@ def get_teams_in_league(league_id):
         for t in teams
     ]
 
-# Fetch and rank players by most appearances
-def get_top_players(team_id, limit=20):
-    print(f"👥 Fetching players for team ID {team_id}")
-    all_players = []
-    page = 1
-    while True:
-        url = f"https://v3.football.api-sports.io/players?team={team_id}&season={SEASON}&page={page}"
-        res = requests.get(url, headers=headers)
-        if res.status_code != 200:
-            print(f"❌ Failed to fetch team {team_id}: {res.status_code}")
-            break
-        response = res.json().get("response", [])
-        if not response:
-            break
-        all_players.extend(response)
-        page += 1
+# Fetch and rank players by most appearances. Each team's result is
+# checkpointed, so a rerun only fetches teams that are stale or missing.
+def get_top_players(client, team_id, limit=20):
+    def fetch():
+        print(f"👥 Fetching players for team ID {team_id}")
+        return rank_players(client.get_all_pages("players", team=team_id, season=SEASON), limit)
+
+    try:
+        return client.checkpoint("top_players", {"team": team_id, "season": SEASON, "limit": limit}, fetch)
+    except QuotaExceeded:
+        raise
+    except (ApiError, requests.RequestException) as exc:
+        print(f"❌ Failed to fetch team {team_id}: {exc}")
+        return []
 
+def rank_players(all_players, limit):
     if not all_players:
         return []
 
@@ -154,29 +150,31 @@ def get_top_players(team_id, limit=20):
 
     return result
 
-# Main collection logic
-all_data = {"chelsea_squads": {}, "opposition": defaultdict(lambda: defaultdict(dict))}
+# Main collection logic. Each stage's requests run concurrently; results are
+# assembled in squad / league / team order so the output is deterministic.
+def collect(client):
+    squads = list(squad_team_ids.items())
+    squad_leagues = client.map(lambda squad: get_team_leagues(client, squad[1])[:2], squads)
 
-for squad_name, team_id in squad_team_ids.items():
-    print(f"=== Processing {squad_name} squad ===")
+    league_jobs = [(squad_name, team_id, league) for (squad_name, team_id), leagues in zip(squads, squad_leagues)
+                   for league in leagues]
+    league_teams = client.map(lambda job: get_teams_in_league(client, job[2]["league_id"]), league_jobs)
 
-    # Store Chelsea players
-    all_data["chelsea_squads"][squad_name] = get_top_players(team_id)
-
-    leagues = get_team_leagues(team_id)[:2]
-
-    for league in leagues:
-        league_id = league["league_id"]
-        league_name = league["league_name"]
-
-        teams = get_teams_in_league(league_id)
+    # (squad, league, team id, team name): Chelsea squads first (league None),
+    # then up to five opponents from each league
+    team_jobs = [(squad_name, None, team_id, None) for squad_name, team_id in squads]
+    for (squad_name, team_id, league), teams in zip(league_jobs, league_teams):
         selected = [t for t in teams if t["team_id"] != team_id][:5]
+        team_jobs.extend((squad_name, league["league_name"], t["team_id"], t["team_name"]) for t in selected)
+    players = client.map(lambda job: get_top_players(client, job[2]), team_jobs)
 
-        for team in selected:
-            team_id = team["team_id"]
-            team_name = team["team_name"]
-            players = get_top_players(team_id)
-            all_data["opposition"][squad_name][league_name][team_name] = players
+    all_data = {"chelsea_squads": {}, "opposition": defaultdict(lambda: defaultdict(dict))}
+    for (squad_name, league_name, _, team_name), team_players in zip(team_jobs, players):
+        if league_name is None:
+            all_data["chelsea_squads"][squad_name] = team_players
+        else:
+            all_data["opposition"][squad_name][league_name][team_name] = team_players
+    return all_data
 
 # Save output
 def convert(obj):
@@ -184,7 +182,27 @@ def convert(obj):
         obj = {k: convert(v) for k, v in obj.items()}
     return obj
 
-with open("DATA/players.json", "w") as f:
-    json.dump(convert(all_data), f, indent=4)
+def main():
+    parser = argparse.ArgumentParser(description="Fetch squad and opposition players from API-Football.")
+    parser.add_argument("--output", default="DATA/players.json")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent requests")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="on-disk response cache")
+    parser.add_argument("--refresh", action="store_true", help="refetch everything, ignoring cached responses")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cache = ResponseCache(args.cache_dir, refresh=args.refresh)
+    with ApiClient(API_KEY, max_workers=args.workers, cache=cache) as client:
+        all_data = collect(client)
+        stats = client.stats
+
+    with open(args.output, "w") as f:
+        json.dump(convert(all_data), f, indent=4)
+
+    print(f"✅ Data collection complete. Saved to {args.output} "
+          f"({stats['requests']} requests, {stats['retries']} retries, {time.perf_counter() - start:.1f}s)")
+    print(f"Cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses, {cache.stats['stale']} stale")
+
 
-print("✅ Data collection complete. Saved to players.json")
+if __name__ == "__main__":
+    main()
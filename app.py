@@ -1,4 +1,9 @@
 from dash import Dash, dcc, html, Input, Output
+import pandas as pd
+
+# Pages share the registry's DataFrames as shallow copies, see utils/data_registry.py
+pd.set_option("mode.copy_on_write", True)
+
 import pages.homepage as homepage
 import pages.biography as biography
 
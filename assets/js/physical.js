@@ -0,0 +1,12 @@
+// Clientside callbacks for the physical development dropdowns (see pages/physical_development.py)
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    physical: {
+        // Quality options and default value of the selected movement, from the
+        // movement -> {options, value} index held in a dcc.Store
+        qualityOptions: function(movement, index) {
+            const entry = (index && index[movement]) || {options: [], value: null};
+            return [entry.options, entry.value];
+        }
+    }
+});
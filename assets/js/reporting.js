@@ -0,0 +1,64 @@
+// Clientside callbacks for the reporting-period sliders (see utils/components.py)
+
+// Pending idle commits per slider: {timer, resolve}
+const pendingCommits = {};
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    reporting: {
+        // Commit a held drag as the slider value once it has been still for `idleMs`;
+        // a release (or a newer drag position) cancels the pending commit
+        commitIdle: function(dragValue, value, idleMs) {
+            const noUpdate = window.dash_clientside.no_update;
+            const triggered = window.dash_clientside.callback_context.triggered.map(t => t.prop_id);
+            const sliderId = triggered.length ? triggered[0].slice(0, triggered[0].lastIndexOf(".")) : "";
+
+            const pending = pendingCommits[sliderId];
+            if (pending) {
+                clearTimeout(pending.timer);
+                pending.resolve(noUpdate);
+                delete pendingCommits[sliderId];
+            }
+            if (!triggered.some(id => id.endsWith(".drag_value")) || !dragValue ||
+                JSON.stringify(dragValue) === JSON.stringify(value)) {
+                return noUpdate;
+            }
+            return new Promise(resolve => {
+                const timer = setTimeout(() => {
+                    delete pendingCommits[sliderId];
+                    resolve(dragValue);
+                }, idleMs);
+                pendingCommits[sliderId] = {timer: timer, resolve: resolve};
+            });
+        },
+
+        // "Select Report Period: dd/mm/yyyy – dd/mm/yyyy" from slider timestamps (seconds).
+        // Slider values are UTC-midnight epochs, so they are read in UTC, not local time
+        label: function(value) {
+            if (!value) {
+                return window.dash_clientside.no_update;
+            }
+            const pad = n => String(n).padStart(2, "0");
+            const fmt = ts => {
+                const d = new Date(ts * 1000);
+                return `${pad(d.getUTCDate())}/${pad(d.getUTCMonth() + 1)}/${d.getUTCFullYear()}`;
+            };
+            return `Select Report Period: ${fmt(value[0])} – ${fmt(value[1])}`;
+        },
+
+        // Move a figure's x-axis to the slider window without touching its data
+        xRange: function(value, figure) {
+            if (!value || !figure || !figure.layout) {
+                return window.dash_clientside.no_update;
+            }
+            // "yyyy-mm-dd hh:mm:ss" in UTC, like the label
+            const iso = ts => new Date(ts * 1000).toISOString().slice(0, 19).replace("T", " ");
+            const xaxis = Object.assign({}, figure.layout.xaxis, {
+                range: [iso(value[0]), iso(value[1])],
+                autorange: false
+            });
+            return Object.assign({}, figure, {
+                layout: Object.assign({}, figure.layout, {xaxis: xaxis})
+            });
+        }
+    }
+});
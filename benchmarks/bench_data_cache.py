@@ -0,0 +1,63 @@
+"""
+Report cold-start and warm-start load times for the preprocessed dataset cache.
+
+Run from the repository root (requires pyarrow):
+
+    python -m benchmarks.bench_data_cache
+    python -m benchmarks.bench_data_cache --cache-dir /tmp/cfc-cache --repeat 5
+
+Cache entries are written to a temporary subdirectory (of --cache-dir when
+given), which is removed afterwards; existing cache files are never touched.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from utils import data_cache
+from utils.data_registry import DATASETS, CACHEABLE_LOADERS
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cache-dir", default=None, help="parent of the temporary cache directory")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if not data_cache.available():
+        raise SystemExit("pyarrow is required for the dataset cache")
+
+    if args.cache_dir:
+        os.makedirs(args.cache_dir, exist_ok=True)
+    print(f"{'dataset':>10} {'no cache (s)':>13} {'cold (s)':>10} {'warm (s)':>10} {'speed-up':>9}")
+    with tempfile.TemporaryDirectory(prefix="cfc-cache-", dir=args.cache_dir) as root:
+        for name, (loader, path) in DATASETS.items():
+            if loader not in CACHEABLE_LOADERS:
+                continue
+            plain_time, plain = timed(lambda: loader(path), args.repeat)
+
+            # A fresh directory per dataset, so the first load is always cold
+            cache_dir = os.path.join(root, name)
+            cold_time, (_, cold_source) = timed(lambda: data_cache.cached_load(name, loader, path, cache_dir), 1)
+            warm_time, (warm, warm_source) = timed(
+                lambda: data_cache.cached_load(name, loader, path, cache_dir), args.repeat
+            )
+            assert (cold_source, warm_source) == ("source", "cache")
+            pd.testing.assert_frame_equal(plain, warm)
+
+            print(f"{name:>10} {plain_time:13.4f} {cold_time:10.4f} {warm_time:10.4f} {plain_time / warm_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
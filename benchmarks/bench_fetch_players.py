@@ -0,0 +1,129 @@
+"""
+Time DATA/fetch_players.py against a local stub of the API-Football endpoints.
+
+The stub (tests/stub_api.py) replays canned responses - generated here, or
+recorded ones loaded with --canned (a JSON object mapping
+"endpoint?key=value&..." with sorted parameters to payloads) - after a fixed
+latency, and can fail a share of requests with 429/500 to exercise the
+client's retries. The script is run serially and concurrently from an empty
+response cache, then again on the warm cache, and the outputs are checked to
+be identical. Run from the repository root:
+
+    python -m benchmarks.bench_fetch_players
+    python -m benchmarks.bench_fetch_players --latency 0.1 --fail-rate 0.1 --workers 16
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from tests.stub_api import StubApi, canned_key
+
+SCRIPT = os.path.join("DATA", "fetch_players.py")
+SQUAD_TEAM_IDS = [49, 1853, 7192, 15391]
+POSITIONS = ["Goalkeeper", "Defender", "Midfielder", "Attacker"]
+
+
+def canned_player(team_id, number):
+    player_id = team_id * 100 + number
+    rng = random.Random(player_id)
+    return {
+        "player": {
+            "id": player_id, "name": f"Player {player_id}", "age": rng.randint(17, 35),
+            "height": f"{rng.randint(165, 200)} cm", "weight": f"{rng.randint(60, 95)} kg",
+            "nationality": "England", "photo": f"https://media.example/{player_id}.png",
+        },
+        "statistics": [{
+            "games": {
+                "appearences": rng.randint(0, 38), "minutes": rng.randint(0, 3400),
+                "position": POSITIONS[number % 4], "rating": f"{rng.uniform(6, 8):.6f}",
+            },
+            "goals": {"total": rng.randint(0, 20), "assists": rng.randint(0, 10),
+                      "saves": rng.randint(0, 90), "conceded": rng.randint(0, 50)},
+            "passes": {"total": rng.randint(0, 2000), "key": rng.randint(0, 60), "accuracy": rng.randint(50, 95)},
+            "tackles": {"total": rng.randint(0, 80), "blocks": rng.randint(0, 20), "interceptions": rng.randint(0, 40)},
+            "duels": {"total": rng.randint(0, 300), "won": rng.randint(0, 150)},
+            "dribbles": {"success": rng.randint(0, 60)},
+            "shots": {"total": rng.randint(0, 80), "on": rng.randint(0, 40)},
+        }],
+    }
+
+
+def generate_canned(season=2023, leagues_per_team=3, teams_per_league=8, pages=3, per_page=20):
+    canned = {}
+    ok = {"errors": []}
+    for squad_team in SQUAD_TEAM_IDS:
+        leagues = [{"league": {"id": squad_team * 10 + i, "name": f"League {squad_team}-{i}"}}
+                   for i in range(leagues_per_team - 1)]
+        leagues.append({"league": {"id": 667, "name": "Friendlies Clubs"}})
+        canned[canned_key("leagues", {"team": squad_team, "season": season})] = {**ok, "response": leagues}
+
+        for league in leagues[:-1]:
+            league_id = league["league"]["id"]
+            team_ids = [squad_team] + [league_id * 100 + i for i in range(teams_per_league - 1)]
+            canned[canned_key("teams", {"league": league_id, "season": season})] = {
+                **ok, "response": [{"team": {"id": t, "name": f"Team {t}"}} for t in team_ids]
+            }
+            for team_id in team_ids:
+                for page in range(1, pages + 1):
+                    players = [canned_player(team_id, (page - 1) * per_page + n) for n in range(per_page)]
+                    canned[canned_key("players", {"team": team_id, "season": season, "page": page})] = {
+                        **ok, "response": players, "paging": {"current": page, "total": pages}
+                    }
+    return canned
+
+
+def run_fetch(base_url, workers, output, cache_dir):
+    env = dict(os.environ, API_FOOTBALL_BASE_URL=base_url, API_FOOTBALL_REQUESTS_PER_MINUTE="6000")
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, SCRIPT, "--workers", str(workers), "--output", output, "--cache-dir", cache_dir],
+        env=env, check=True, stdout=subprocess.DEVNULL
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--canned", default=None, help="JSON file of recorded responses")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per stub response")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests answered 429/500")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    if args.canned:
+        with open(args.canned) as f:
+            canned = json.load(f)
+    else:
+        canned = generate_canned()
+
+    outputs = []
+    print(f"{'run':>6} {'workers':>8} {'requests':>9} {'failed':>7} {'time (s)':>9}")
+    # One server throughout: cache entries are keyed on its URL
+    server = StubApi(canned, args.latency, args.fail_rate)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            runs = [("cold", 1, "serial"), ("cold", args.workers, "concurrent"), ("warm", args.workers, "concurrent")]
+            for i, (label, workers, cache_name) in enumerate(runs):
+                with server.lock:
+                    server.requests = server.failures = 0
+                output = os.path.join(tmp, f"players_{i}.json")
+                elapsed = run_fetch(server.url, workers, output, os.path.join(tmp, f"cache_{cache_name}"))
+                with open(output) as f:
+                    outputs.append(json.load(f))
+                print(f"{label:>6} {workers:8d} {server.requests:9d} {server.failures:7d} {elapsed:9.2f}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("outputs identical" if all(o == outputs[0] for o in outputs) else "OUTPUTS DIFFER")
+
+
+if __name__ == "__main__":
+    main()
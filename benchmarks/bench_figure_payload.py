@@ -0,0 +1,53 @@
+"""
+Report the serialised size of the gradient bar charts in segment and compact mode.
+
+Each figure is encoded the way Dash sends it (PlotlyJSONEncoder) for the
+latest window of the given length. Run from the repository root:
+
+    python -m benchmarks.bench_figure_payload
+    python -m benchmarks.bench_figure_payload --weeks 6 --player 1
+"""
+import argparse
+import json
+
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+from utils import data_registry
+from utils.constants import metrics
+from utils.data_loader import GradientSegmenter
+from utils.plot_helpers import base_bar_figure
+
+
+def payload_bytes(figure):
+    return len(json.dumps(figure, cls=PlotlyJSONEncoder).encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--player", default=None, help="player id (single-athlete exports ignore it)")
+    args = parser.parse_args()
+
+    gps_df = data_registry.player_frame("gps", args.player)
+    segmenter = GradientSegmenter.from_wide(gps_df, metrics)
+    end = gps_df.loc[gps_df["distance"] > 0, "date"].max()
+    start = end - pd.Timedelta(weeks=args.weeks)
+
+    print(f"{args.weeks}-week window {start:%d/%m/%Y} - {end:%d/%m/%Y}")
+    print(f"{'metric':>22} {'bars':>6} {'segments (B)':>13} {'compact (B)':>12} {'ratio':>7}")
+    totals = [0, 0]
+    for metric in metrics:
+        segments = segmenter.segments(metric, start, end)
+        bars = segmenter.bars(metric, start, end)
+        sizes = (
+            payload_bytes(base_bar_figure(segments, metric, [start, end])),
+            payload_bytes(base_bar_figure(bars, metric, [start, end], compact=True)),
+        )
+        totals = [t + s for t, s in zip(totals, sizes)]
+        print(f"{metric:>22} {len(bars):6d} {sizes[0]:13,d} {sizes[1]:12,d} {sizes[0] / sizes[1]:6.1f}x")
+    print(f"{'total':>22} {'':6} {totals[0]:13,d} {totals[1]:12,d} {totals[0] / totals[1]:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,21 @@
 from dash import html, dcc, Input, Output, State, callback
-import json
 import plotly.graph_objects as go
 from pages import load_demand, physical_development, recovery, injury_history, external_factors
+from utils import data_registry
+from utils.data_loader import RADAR_RATE_STATS
 import matplotlib.colors as mcolors
-import pandas as pd
 
 # Load priority areas
-priority_df = pd.read_csv("DATA/CFC Individual Priority Areas.csv")
+priority_df = data_registry.get("priority_areas")
 
 # Set plot colors
 colors = [mcolors.to_hex(c) for c in ['tab:blue', 'tab:orange', 'tab:green']]
 
-# Load data
-with open("DATA/players.json") as f:
-    data = json.load(f)
-
 # Flatten players by ID for quick lookup
-player_lookup = {}
-for group in ["chelsea_squads", "opposition"]:
-    if group == "chelsea_squads":
-        for squad in data[group]:
-            for p in data[group][squad]:
-                player_lookup[str(p["id"])] = p
-    else:
-        for squad in data[group]:
-            for comp in data[group][squad]:
-                for team in data[group][squad][comp]:
-                    for p in data[group][squad][comp][team]:
-                        player_lookup[str(p["id"])] = p
+player_lookup = data_registry.player_lookup()
+
+# Per-90 radar stats, maxima and percentile ranks per position
+radar_stats = data_registry.radar_stats()
 
 def render(player_id):
     player = player_lookup.get(str(player_id))
@@ -36,9 +24,7 @@ def render(player_id):
 
     position = player.get("position")
     comparison_options = [
-        {"label": f"{p['name']} ({p['position']})", "value": str(p["id"])}
-        for p in player_lookup.values()
-        if p.get("position") == position and str(p["id"]) != str(player_id)
+        option for option in radar_stats.comparison_options(position) if option["value"] != str(player_id)
     ]
 
     return html.Div([
@@ -161,6 +147,15 @@ def render_tab(tab, player_id):
     elif tab == "External":
         return external_factors.render_external_factors(player_id)
 
+# "Passes: 41.30 per 90, percentile 85" for each of a player's radar stats
+def radar_hover(player_id, keys):
+    values = radar_stats.values(player_id, keys)
+    percentiles = radar_stats.percentiles(player_id, keys)
+    return [
+        f"{k}: {v:.2f}{'' if k in RADAR_RATE_STATS else ' per 90'}, percentile {pct:.0f}"
+        for k, v, pct in zip(keys, values, percentiles)
+    ]
+
 @callback(
     Output("radar-compare", "figure"),
     Input("comparison-dropdown", "value"),
@@ -170,33 +165,11 @@ def update_radar(compare_id, base_id):
     base_player = player_lookup.get(str(base_id))
     compare_player = player_lookup.get(str(compare_id)) if compare_id else None
 
-    def compute_per_90(p):
-        radar = p.get("radar", {})
-        mins = p.get("minutes", 1) or 1
-        return {
-            k: (v / mins * 90 if k not in ["Pass Accuracy", "Av. Rating"] else v)
-            for k, v in radar.items()
-        }
-
-    def normalize(data, max_values):
-        return [round(data[k] / max_values.get(k, 1), 2) for k in data]
-
-    base_data = compute_per_90(base_player)
-    comp_data = compute_per_90(compare_player) if compare_player else None
-
-    # Get max values for position
+    # Normalised against the base player's position maxima
     position = base_player.get("position")
-    radar_keys = base_data.keys()
-    max_vals = {k: 0 for k in radar_keys}
-    for p in player_lookup.values():
-        if p.get("position") != position:
-            continue
-        pdata = compute_per_90(p)
-        for k in radar_keys:
-            max_vals[k] = max(max_vals[k], pdata.get(k, 0))
-
-    base_r = normalize(base_data, max_vals)
-    theta = list(radar_keys)
+    theta = list(base_player.get("radar", {}).keys())
+    base_r = [round(float(v), 2) for v in radar_stats.normalised(base_id, theta)]
+    base_hover = radar_hover(base_id, theta)
 
     # 👇 Append the first value to close the shape
     base_r.append(base_r[0])
@@ -208,12 +181,16 @@ def update_radar(compare_id, base_id):
             theta=theta,
             fill="toself",
             name=base_player["name"],
-            line=dict(color=colors[0])
+            line=dict(color=colors[0]),
+            text=base_hover + base_hover[:1],
+            hoverinfo="name+text"
         )
     ]
 
-    if comp_data:
-        comp_r = normalize(comp_data, max_vals)
+    if compare_player and compare_player.get("radar"):
+        comp_keys = list(compare_player.get("radar", {}).keys())
+        comp_r = [round(float(v), 2) for v in radar_stats.normalised(compare_id, comp_keys, position)]
+        comp_hover = radar_hover(compare_id, comp_keys)
         comp_r.append(comp_r[0])
 
         traces.append(go.Scatterpolar(
@@ -221,7 +198,9 @@ def update_radar(compare_id, base_id):
             theta=theta,
             fill="toself",
             name=compare_player["name"],
-            line=dict(color=colors[1])
+            line=dict(color=colors[1]),
+            text=comp_hover + comp_hover[:1],
+            hoverinfo="name+text"
         ))
 
     return go.Figure(
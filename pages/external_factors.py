@@ -1,4 +1,4 @@
-from dash import callback, dcc, html, Input, Output, State
+from dash import html
 from utils.components import collapsible_section
 
 def render_external_factors(player_id):
@@ -71,14 +71,3 @@ def render_external_factors(player_id):
         }),
 
     ])
-
-@callback(
-    Output("external_factors_info-collapse", "is_open"),
-    Input("external_factors_info-toggle", "n_clicks"),
-    State("external_factors_info-collapse", "is_open"),
-    prevent_initial_call=True
-)
-def toggle_external_factors_info(n, is_open):
-    if n:
-        return not is_open
-    return is_open
\ No newline at end of file
@@ -1,20 +1,19 @@
 from dash import html, dcc
-import json
-from utils.data_loader import load_fixtures, load_gps_data, load_physical_data, load_recovery_data
+from utils import data_registry
 from utils.components import create_fixture_cards
 from utils.plot_helpers import bubble_plot, create_physical_heatmap, emboss_color, recovery_radar_chart
 import dash_daq as daq
 
-fixtures = load_fixtures("DATA/fixtures.json")
+fixtures = data_registry.get("fixtures")
 fixture_cards = create_fixture_cards(fixtures)
 
 current_season = "2023/2024"  # Replace with the appropriate season
-gps_df = load_gps_data("DATA/CFC GPS Data.csv")
+gps_df = data_registry.get("gps")
 gps_df = gps_df[(gps_df["season"] == current_season) & (gps_df["day_duration"] > 0)]
 
-phys_df = load_physical_data("DATA/CFC Physical Capability Data_.csv")
+phys_df = data_registry.get("physical")
 
-rec_df = load_recovery_data("DATA/CFC Recovery status Data.csv")
+rec_df = data_registry.get("recovery")
 radar_fig = recovery_radar_chart(rec_df)
 score = rec_df["emboss_baseline_score"].iloc[-1]
 score_color = emboss_color(score)
@@ -1,7 +1,6 @@
-from dash import callback, dcc, html, Input, Output, State
+from dash import dcc, html
 from utils.components import collapsible_section
 import plotly.graph_objects as go
-from utils.constants import body_markers
 
 def render_injury(player_id):
     return html.Div([
@@ -126,15 +125,3 @@ def render_injury(player_id):
     ]),
 
     ])
-
-
-@callback(
-    Output("injury_info-collapse", "is_open"),
-    Input("injury_info-toggle", "n_clicks"),
-    State("injury_info-collapse", "is_open"),
-    prevent_initial_call=True
-)
-def toggle_injury_info(n, is_open):
-    if n:
-        return not is_open
-    return is_open
\ No newline at end of file
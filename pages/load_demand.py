@@ -1,37 +1,65 @@
-from dash import html, dcc, Input, Output, State, callback, ctx, no_update
+from dash import html, dcc, Input, Output, State, ctx, no_update
 from datetime import datetime, timedelta
 import matplotlib.colors as mcolors
-import plotly.express as px
-from utils.data_loader import load_player_data, load_gps_data, compute_gradient_df, compute_acwr
-from utils.plot_helpers import base_bar_figure, get_matchday_shapes_annotations, bubble_plot_figure
-from utils.components import collapsible_section, date_slider
+import numpy as np
+from utils.data_loader import GradientSegmenter, ACWRCache, WindowAggregates, date_window, session_statistics
+from utils import data_registry
+from utils.plot_helpers import bubble_plot_figure
+from utils.components import collapsible_section, section_collapse, section_open_prop, date_slider, windowed_callback, reporting_clientside, FULL_SERIES
+from utils.figure_cache import figure_cache, window_key
+from utils.bar_figures import cached_bar_figure, player_overlays
+from utils.downsample import point_budget, window_indices
 from utils.constants import *
 
 # Load data & settings
 colors = [mcolors.to_hex(c) for c in ['tab:blue', 'tab:orange', 'tab:green']]
-player_lookup = load_player_data("DATA/players.json")
-gps_df = load_gps_data("DATA/CFC GPS Data.csv")
-gradient_df = compute_gradient_df(gps_df, metrics)
-
-training_avg_duration = gps_df[gps_df["is_training_day"]]["day_duration"].mean()
-match_avg_duration = gps_df[gps_df["is_match_day"]]["day_duration"].mean()
-training_avg_distance = gps_df[gps_df["is_training_day"]]["distance"].mean()
-match_avg_distance = gps_df[gps_df["is_match_day"]]["distance"].mean()
-training_avg_distance_per_min = gps_df[gps_df["is_training_day"]]["distance_per_min"].mean()
-match_avg_distance_per_min = gps_df[gps_df["is_match_day"]]["distance_per_min"].mean()
-training_avg_peak_speed = gps_df[gps_df["is_training_day"]]["peak_speed"].mean()
-match_avg_peak_speed = gps_df[gps_df["is_match_day"]]["peak_speed"].mean()
-
-valid_distances = gps_df[gps_df["distance"] > 0]
-max_date = valid_distances["date"].max()
-min_date = max_date - timedelta(weeks=52)
-
-shapes, annotations = get_matchday_shapes_annotations(gps_df)
-
-section_ids = [
-    "load_demand_info", 
-    "day_duration", "distance", "distance_per_min", "top_speed",
-    "high_speed", "accel_decel", "hr_zones", "acwr"
+
+# ACWR for every dropdown metric, computed once per method
+acwr_metrics = ["distance", "distance_per_min", "accel_decel_over_3_5", "distance_over_21"]
+
+
+# Per-player data, partitioned and cached by the data registry
+def player_gps(player_id):
+    return data_registry.player_frame("gps", player_id)
+
+def player_segmenter(player_id):
+    return data_registry.player_derived(
+        "gps", player_id, "gradient_segmenter", lambda df: GradientSegmenter.from_wide(df, metrics)
+    )
+
+def player_acwr(player_id):
+    return data_registry.player_derived("gps", player_id, "acwr", lambda df: ACWRCache(df, acwr_metrics))
+
+# Running totals behind the summary tiles and HR zone percentages
+def window_aggregates(df):
+    active = df["day_duration"] > 0
+    return WindowAggregates(df["date"], {
+        "distance": df["distance"].where(active, 0),
+        "match_days": active & (df["md_plus_code"] == 0),
+        "training_days": active & (df["md_plus_code"] != 0),
+        **{zone: df[zone] for zone in zone_cols},
+    })
+
+def player_aggregates(player_id):
+    return data_registry.player_derived("gps", player_id, "window_aggregates", window_aggregates)
+
+def player_session_statistics(player_id):
+    return data_registry.player_derived("gps", player_id, "session_statistics", lambda df: session_statistics(df, metrics))
+
+def session_averages(player_id, metric):
+    # (match average, training average) of a metric over the player's history
+    statistics = player_session_statistics(player_id)
+    return tuple(
+        statistics.at[session_type, (metric, "mean")] if session_type in statistics.index else np.nan
+        for session_type in ("Match", "Training")
+    )
+
+# Collapsible bar chart sections: (section id, metric, hover suffix)
+bar_sections = [
+    ("day_duration", "day_duration", " min"),
+    ("distance", "distance", " m"),
+    ("distance_per_min", "distance_per_min", " m/min"),
+    ("top_speed", "peak_speed", " km/h"),
 ]
 
 # Helper: convert slider timestamps to datetime range
@@ -40,7 +68,25 @@ def get_date_range(selected_range):
     end_date = datetime.fromtimestamp(selected_range[1])
     return start_date, end_date
 
+# Rows of a date-sorted full-history series to plot: all of them while they fit the
+# point budget, otherwise an overview plus the visible window (see utils/downsample.py)
+def is_downsampled(df):
+    return len(df) > point_budget()
+
+def downsampled(df, values, selected_range, method="lttb"):
+    if not is_downsampled(df):
+        return df
+    start_date, end_date = get_date_range(selected_range)
+    return df.iloc[window_indices(df["date"], values, start_date, end_date, point_budget(), method)]
+
 def render_load_demand(player_id):
+    gps_df = player_gps(player_id)
+    valid_distances = gps_df[gps_df["distance"] > 0]
+    if valid_distances.empty:
+        return html.H4("No load data available for this player.", style={"textAlign": "center"})
+    max_date = valid_distances["date"].max()
+    min_date = max_date - timedelta(weeks=52)
+
     return html.Div([
         collapsible_section(
             "Module Guide",
@@ -110,7 +156,10 @@ def render_load_demand(player_id):
             ),
             dcc.Graph(id="high-accel-graph", config={"displayModeBar": False})
         ]), "accel_decel"),
-        collapsible_section("Heart Rate Zone Duration", html.Div(id="hr_zones-content"), "hr_zones"),
+        collapsible_section("Heart Rate Zone Duration", html.Div([
+            html.Div(id="hr_zones-content"),
+            dcc.Graph(id="hr-zones-graph", config={"displayModeBar": False})
+        ]), "hr_zones"),
         collapsible_section("Acute:Chronic Workload Ratio", html.Div([
             dcc.Dropdown(
                 id="acwr-metric-dropdown",
@@ -125,172 +174,130 @@ def render_load_demand(player_id):
                 searchable=False,
                 style={"width": "300px", "marginBottom": "10px", "margin": "0 auto"}
             ),
+            dcc.Dropdown(
+                id="acwr-method-dropdown",
+                options=[
+                    {"label": "Rolling Average (sessions)", "value": "rolling"},
+                    {"label": "Rolling Average (calendar days)", "value": "rolling_calendar"},
+                    {"label": "EWMA (sessions)", "value": "ewma"},
+                    {"label": "EWMA (calendar days)", "value": "ewma_calendar"},
+                ],
+                value="rolling",
+                clearable=False,
+                searchable=False,
+                style={"width": "300px", "marginTop": "10px", "margin": "10px auto 0 auto"}
+            ),
             dcc.Graph(id="acwr-graph", config={"displayModeBar": False})
         ]), "acwr")
     ])
 
-# Update reporting period label
-@callback(
-    Output("reporting-period-label", "children"),
-    Input("reporting-slider", "value")
-)
-def update_reporting_load(value):
-    start, end = get_date_range(value)
-    return f"Select Report Period: {start.strftime('%d/%m/%Y')} – {end.strftime('%d/%m/%Y')}"
-
-# Toggle collapsible sections (same as before)
-@callback(
-    [Output(f"{section_id}-collapse", "is_open") for section_id in section_ids],
-    [Input(f"{section_id}-toggle", "n_clicks") for section_id in section_ids],
-    [State(f"{section_id}-collapse", "is_open") for section_id in section_ids],
-    prevent_initial_call=True
-)
-def toggle_collapsible(*args):
-    n = len(section_ids)
-    clicks = args[:n]
-    states = args[n:]
-    triggered = ctx.triggered_id
-    return [
-        not state if triggered == f"{section_id}-toggle" else state
-        for section_id, state in zip(section_ids, states)
+# Reporting period label and x-range-only graph updates run in the browser
+reporting_clientside(
+    "reporting-period-label", "reporting-slider",
+    graph_ids=["hr-zones-graph", "acwr-graph"],
+    windowed_graph_ids=[
+        "day_duration-graph", "distance-graph", "distance_per_min-graph", "peak_speed-graph",
+        "high-speed-graph", "high-accel-graph"
     ]
+)
 
-# Generic callback for bar chart metrics (sections without built-in dropdowns)
-def render_bar_chart(metric, selected_range, match_avg, training_avg, hover_suffix):
-    start_date, end_date = get_date_range(selected_range)
-    x_range = [start_date, end_date]
-    range_df = gradient_df[(gradient_df["date"] >= start_date) & (gradient_df["date"] <= end_date)]
+# Gradient bar figure of one metric, shared through the figure cache
+def gradient_bar_figure(metric, selected_range, player_id, hover_suffix):
+    match_avg, training_avg = session_averages(player_id, metric)
+    return cached_bar_figure(
+        ("load_demand", "bar", metric, hover_suffix, data_registry.player_token("gps", player_id)),
+        player_segmenter(player_id), metric, selected_range, overlays=player_overlays(player_id),
+        match_avg=match_avg, training_avg=training_avg, hover_suffix=hover_suffix
+    )
+
+# Bar chart graph of a collapsible section (sections without built-in dropdowns)
+def render_bar_chart(metric, selected_range, player_id, hover_suffix):
     return dcc.Graph(
-        figure=base_bar_figure(
-            range_df, metric, x_range, match_avg, training_avg,
-            hover_suffix=hover_suffix, shapes=shapes, annotations=annotations
-        ),
+        id=f"{metric}-graph",
+        figure=gradient_bar_figure(metric, selected_range, player_id, hover_suffix),
         config={"displayModeBar": False}
     )
 
-@callback(
-    Output("day_duration-content", "children"),
-    Input("day_duration-collapse", "is_open"),
-    Input("reporting-slider", "value")
-)
-def render_day_duration(is_open, selected_range):
-    if not is_open:
-        return no_update
-    return render_bar_chart("day_duration", selected_range, match_avg_duration, training_avg_duration, " min")
-
-@callback(
-    Output("distance-content", "children"),
-    Input("distance-collapse", "is_open"),
-    Input("reporting-slider", "value")
-)
-def render_distance(is_open, selected_range):
-    if not is_open:
-        return no_update
-    return render_bar_chart("distance", selected_range, match_avg_distance, training_avg_distance, " m")
+# Share of time in each HR zone over the window
+def hr_zone_percentages(totals):
+    zone_totals = {zone: totals[zone] for zone in zone_cols}
+    total_time = sum(zone_totals.values())
+    zone_percentages = {
+        zone.replace("_sec", "").replace("hr_zone_", "Zone "): (val / total_time * 100 if total_time else 0)
+        for zone, val in zone_totals.items()
+    }
 
-@callback(
-    Output("distance_per_min-content", "children"),
-    Input("distance_per_min-collapse", "is_open"),
-    Input("reporting-slider", "value")
-)
-def render_distance_per_min(is_open, selected_range):
-    if not is_open:
-        return no_update
-    return render_bar_chart("distance_per_min", selected_range, match_avg_distance_per_min, training_avg_distance_per_min, " m/min")
+    return html.Div([
+        html.Div([
+            html.H5(zone, style={"margin": "0", "fontSize": "10px", "color": "#555"}),
+            html.P(f"{perc:.1f}%", style={"margin": "0", "fontWeight": "bold"})
+        ], style={"textAlign": "center", "minWidth": "60px"})
+        for zone, perc in zone_percentages.items()
+    ], style={"display": "flex", "flexDirection": "row", "justifyContent": "space-around", "marginBottom": "10px"})
 
-@callback(
-    Output("top_speed-content", "children"),
-    Input("top_speed-collapse", "is_open"),
-    Input("reporting-slider", "value")
+# The zone graph carries the full series and the browser applies slider windows,
+# unless the history is long enough to be downsampled around the window
+@windowed_callback(
+    "reporting-slider",
+    Output("hr-zones-graph", "figure"),
+    Input(section_collapse("hr_zones"), "is_open"),
+    Input("reporting-slider", "value"),
+    State("main-player-id", "data")
 )
-def render_top_speed(is_open, selected_range):
+def render_hr_zones_graph(is_open, selected_range, player_id):
     if not is_open:
         return no_update
-    return render_bar_chart("peak_speed", selected_range, match_avg_peak_speed, training_avg_peak_speed, " km/h")
-
-@callback(
-    Output("hr_zones-content", "children"),
-    Input("hr_zones-collapse", "is_open"),
-    Input("reporting-slider", "value")
-)
-def render_hr_zones(is_open, selected_range):
-    if not is_open:
+    if ctx.triggered_id == "reporting-slider" and not is_downsampled(player_gps(player_id)):
         return no_update
+    key = ("load_demand", "hr_zones", window_key(selected_range), data_registry.player_token("gps", player_id))
+    return figure_cache.get_or_build(key, lambda: hr_zones_figure(selected_range, player_id))
 
+def hr_zones_figure(selected_range, player_id):
     start_date, end_date = get_date_range(selected_range)
     x_range = [start_date, end_date]
-    recent = gps_df[(gps_df["date"] >= start_date) & (gps_df["date"] <= end_date)]
-    zone_totals = {zone: recent[zone].sum() for zone in zone_cols}
-    total_time = sum(zone_totals.values())
-    zone_percentages = {
-        zone.replace("_sec", "").replace("hr_zone_", "Zone "): (val / total_time * 100 if total_time else 0)
-        for zone, val in zone_totals.items()
+    gps_df = player_gps(player_id)
+    # Min/max buckets of the stacked total keep every zone's peaks aligned
+    gps_df = downsampled(gps_df, gps_df[zone_cols].sum(axis=1), selected_range, method="minmax")
+    # Re-windowed in the browser, so every match day is kept
+    shapes, annotations = player_overlays(player_id).window()
+    return {
+        "data": [
+            {
+                "x": gps_df["date"],
+                "y": gps_df[f"hr_zone_{i}_sec"],
+                "stackgroup": "one",
+                "name": f"Zone {i}",
+                "line": {"width": 0.5, "color": zone_colors[i - 1]},
+                "fillcolor": zone_colors[i - 1]
+            } for i in range(1, 6)
+        ],
+        "layout": {
+            "xaxis": {"title": "Date", "range": x_range, "fixedrange": True},
+            "yaxis": {"title": "Time in Zone (sec)", "fixedrange": True},
+            "margin": {"l": 40, "r": 10, "t": 30, "b": 40},
+            "height": 300,
+            "plot_bgcolor": "#fff",
+            "paper_bgcolor": "#fff",
+            "legend": {"x": 0, "y": 1, "xanchor": "left", "yanchor": "top", "font": {"size": 12}},
+            "shapes": shapes,
+            "annotations": annotations,
+            "dragmode": False
+        }
     }
 
-    return html.Div([
-        html.Div([
-            html.Div([
-                html.H5(zone, style={"margin": "0", "fontSize": "10px", "color": "#555"}),
-                html.P(f"{perc:.1f}%", style={"margin": "0", "fontWeight": "bold"})
-            ], style={"textAlign": "center", "minWidth": "60px"})
-            for zone, perc in zone_percentages.items()
-        ], style={"display": "flex", "flexDirection": "row", "justifyContent": "space-around", "marginBottom": "10px"}),
-        dcc.Graph(
-            figure={
-                "data": [
-                    {
-                        "x": gps_df["date"],
-                        "y": gps_df[f"hr_zone_{i}_sec"],
-                        "stackgroup": "one",
-                        "name": f"Zone {i}",
-                        "line": {"width": 0.5, "color": zone_colors[i - 1]},
-                        "fillcolor": zone_colors[i - 1]
-                    } for i in range(1, 6)
-                ],
-                "layout": {
-                    "xaxis": {"title": "Date", "range": x_range, "fixedrange": True},
-                    "yaxis": {"title": "Time in Zone (sec)", "fixedrange": True},
-                    "margin": {"l": 40, "r": 10, "t": 30, "b": 40},
-                    "height": 300,
-                    "plot_bgcolor": "#fff",
-                    "paper_bgcolor": "#fff",
-                    "legend": {"x": 0, "y": 1, "xanchor": "left", "yanchor": "top", "font": {"size": 12}},
-                    "shapes": shapes,
-                    "annotations": annotations,
-                    "dragmode": False
-                }
-            },
-            config={"displayModeBar": False}
-        )
-    ])
+def bubble_figure(selected_range, player_id):
+    def build():
+        window_df = date_window(player_gps(player_id), *get_date_range(selected_range))
+        filtered_df = window_df[window_df["day_duration"] > 0]
+        return bubble_plot_figure(filtered_df)
 
-@callback(
-    Output("bubble-plot", "figure"),
-    Input("reporting-slider", "value")
-)
-def update_bubble_plot(selected_range):
-    start_date, end_date = get_date_range(selected_range)
-    filtered_df = gps_df[
-        (gps_df["date"] >= start_date) & 
-        (gps_df["date"] <= end_date) & 
-        (gps_df["day_duration"] > 0)
-    ]
-    return bubble_plot_figure(filtered_df)
+    key = ("load_demand", "bubble", window_key(selected_range), data_registry.player_token("gps", player_id))
+    return figure_cache.get_or_build(key, build)
 
-@callback(
-    Output("summary-box", "children"),
-    Input("reporting-slider", "value")
-)
-def update_summary_box(selected_range):
-    start_date, end_date = get_date_range(selected_range)
-    recent = gps_df[
-        (gps_df["date"] >= start_date) &
-        (gps_df["date"] <= end_date) &
-        (gps_df["day_duration"] > 0)
-    ]
-    total_distance = int(recent["distance"].sum())
-    matchdays = len(recent[recent["md_plus_code"] == 0])
-    trainingdays = len(recent[recent["md_plus_code"] != 0])
+def summary_box(totals, start_date, end_date):
+    total_distance = int(totals["distance"])
+    matchdays = int(totals["match_days"])
+    trainingdays = int(totals["training_days"])
     return html.Div([
         html.Div([
             html.Div([
@@ -318,52 +325,89 @@ def update_summary_box(selected_range):
         })
     ], style={"width": "100%"})
 
-# Callback to update the high-speed graph based on dropdown and slider inputs
-@callback(
+# Slider-driven outputs of the page, rendered in one request per interaction.
+# Window totals come from running sums; closed sections and outputs whose
+# inputs did not change are skipped with no_update.
+@windowed_callback(
+    "reporting-slider",
+    Output("summary-box", "children"),
+    Output("bubble-plot", "figure"),
+    [Output(f"{section_id}-content", "children") for section_id, _, _ in bar_sections],
+    Output("hr_zones-content", "children"),
     Output("high-speed-graph", "figure"),
-    Input("speed-threshold-dropdown", "value"),
-    Input("reporting-slider", "value")
-)
-def update_high_speed_plot(speed_column, selected_range):
-    start_date, end_date = get_date_range(selected_range)
-    x_range = [start_date, end_date]
-    range_df = gradient_df[(gradient_df["date"] >= start_date) & (gradient_df["date"] <= end_date)]
-    match_avg = gps_df[gps_df["is_match_day"]][speed_column].mean()
-    training_avg = gps_df[gps_df["is_training_day"]][speed_column].mean()
-    return base_bar_figure(
-        range_df, speed_column, x_range, match_avg, training_avg,
-        hover_suffix=" m", shapes=shapes, annotations=annotations
-    )
-
-# Callback to update the acceleration graph based on dropdown and slider inputs
-@callback(
     Output("high-accel-graph", "figure"),
+    Input("reporting-slider", "value"),
+    [Input(section_collapse(section_id), "is_open") for section_id, _, _ in bar_sections],
+    Input(section_collapse("hr_zones"), "is_open"),
+    Input(section_collapse("high_speed"), "is_open"),
+    Input(section_collapse("accel_decel"), "is_open"),
+    Input("speed-threshold-dropdown", "value"),
     Input("accel-threshold-dropdown", "value"),
-    Input("reporting-slider", "value")
+    State("main-player-id", "data")
 )
-def update_high_accel_plot(accel_column, selected_range):
+def render_window(selected_range, *args):
+    # Initial renders report no triggering props: everything is rendered
+    changed = set(ctx.triggered_prop_ids) or None
+    return render_window_outputs(changed, selected_range, *args)
+
+def render_window_outputs(changed, selected_range, *args):
+    *bars_open, hr_open, speed_open, accel_open, speed_column, accel_column, player_id = args
+
+    def triggered(*prop_ids):
+        return changed is None or any(prop_id in changed for prop_id in prop_ids)
+
+    window_changed = triggered("reporting-slider.value")
+    # Full-series bar charts are re-windowed in the browser
+    bars_rewindow = window_changed and not FULL_SERIES
+    hr_render = hr_open and (window_changed or triggered(section_open_prop("hr_zones")))
     start_date, end_date = get_date_range(selected_range)
-    x_range = [start_date, end_date]
-    range_df = gradient_df[(gradient_df["date"] >= start_date) & (gradient_df["date"] <= end_date)]
-    match_avg = gps_df[gps_df["is_match_day"]][accel_column].mean()
-    training_avg = gps_df[gps_df["is_training_day"]][accel_column].mean()
-    return base_bar_figure(
-        range_df, accel_column, x_range, match_avg, training_avg,
-        hover_suffix=" efforts", shapes=shapes, annotations=annotations
+    totals = player_aggregates(player_id).window(start_date, end_date) if window_changed or hr_render else None
+
+    outputs = [
+        summary_box(totals, start_date, end_date) if window_changed else no_update,
+        bubble_figure(selected_range, player_id) if window_changed else no_update,
+    ]
+    for (section_id, metric, hover_suffix), is_open in zip(bar_sections, bars_open):
+        render = is_open and (bars_rewindow or triggered(section_open_prop(section_id)))
+        outputs.append(render_bar_chart(metric, selected_range, player_id, hover_suffix) if render else no_update)
+    outputs.append(hr_zone_percentages(totals) if hr_render else no_update)
+    speed_render = speed_open and (
+        bars_rewindow or triggered("speed-threshold-dropdown.value", section_open_prop("high_speed"))
     )
+    outputs.append(gradient_bar_figure(speed_column, selected_range, player_id, " m") if speed_render else no_update)
+    accel_render = accel_open and (
+        bars_rewindow or triggered("accel-threshold-dropdown.value", section_open_prop("accel_decel"))
+    )
+    outputs.append(gradient_bar_figure(accel_column, selected_range, player_id, " efforts") if accel_render else no_update)
+    return outputs
 
-# Callback to update the ACWR graph based on dropdown and slider inputs
-@callback(
+# Callback to update the ACWR graph based on dropdown inputs; the browser applies slider
+# windows unless the history is long enough to be downsampled around the window
+@windowed_callback(
+    "reporting-slider",
     Output("acwr-graph", "figure"),
     Input("acwr-metric-dropdown", "value"),
-    Input("reporting-slider", "value")
+    Input("reporting-slider", "value"),
+    Input("acwr-method-dropdown", "value"),
+    State("main-player-id", "data")
 )
-def update_acwr_plot(metric, selected_range):
+def update_acwr_plot(metric, selected_range, method, player_id):
     if metric is None:
         return {}
+    method = method or "rolling"
+    if ctx.triggered_id == "reporting-slider" and not is_downsampled(player_acwr(player_id).get(metric, method)):
+        return no_update
+    key = ("load_demand", "acwr", metric, method, window_key(selected_range), data_registry.player_token("gps", player_id))
+    return figure_cache.get_or_build(key, lambda: acwr_figure(metric, method, selected_range, player_id))
+
+def acwr_figure(metric, method, selected_range, player_id):
     start_date, end_date = get_date_range(selected_range)
     x_range = [start_date, end_date]
-    acwr_df = compute_acwr(gps_df, metric)
+    acwr_df = player_acwr(player_id).get(metric, method)
+    acwr_df = downsampled(acwr_df, acwr_df["acwr"], selected_range)
+    band_dates = acwr_df["date"].iloc[[0, -1]].tolist() if len(acwr_df) else []
+    # Re-windowed in the browser, so every match day is kept
+    shapes, annotations = player_overlays(player_id).window()
     return {
         "data": [
             {
@@ -376,8 +420,9 @@ def update_acwr_plot(metric, selected_range):
                 "name": "ACWR"
             },
             {
-                "x": acwr_df["date"].tolist() + acwr_df["date"].tolist()[::-1],
-                "y": [0.8] * len(acwr_df) + [1.5] * len(acwr_df[::-1]),
+                # 0.8-1.5 target band as a single rectangle over the series
+                "x": band_dates + band_dates[::-1],
+                "y": [0.8] * len(band_dates) + [1.5] * len(band_dates),
                 "type": "scatter",
                 "fill": "toself",
                 "fillcolor": "rgba(0, 255, 0, 0.1)",
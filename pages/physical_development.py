@@ -1,17 +1,68 @@
-from dash import callback, dcc, html, Input, Output, State, ctx, no_update
+from dash import clientside_callback, ClientsideFunction, dcc, html, Input, Output, State, no_update
 from datetime import datetime
-from utils.data_loader import load_physical_data, compute_physical_gradient_df
-from utils.plot_helpers import base_bar_figure, create_physical_heatmap
-from utils.components import date_slider, collapsible_section
+from utils.data_loader import physical_metric_frame, physical_metric_key, GradientSegmenter, date_window
+from utils import data_registry
+from utils.plot_helpers import create_physical_heatmap
+from utils.components import date_slider, collapsible_section, section_collapse, window_dependency, windowed_callback, reporting_clientside
+from utils.figure_cache import figure_cache, window_key
+from utils.bar_figures import cached_bar_figure
+
+
+# Per-player data, partitioned and cached by the data registry
+def player_physical(player_id):
+    return data_registry.player_frame("physical", player_id)
+
+# Negative benchmarks are full downward bars scaled by the metric's minimum, as on the
+# recovery page (see the README's gradient bars section)
+def player_segmenter(player_id):
+    return data_registry.player_derived(
+        "physical", player_id, "gradient_segmenter",
+        lambda df: GradientSegmenter.from_long(physical_metric_frame(df), value_col="benchmarkPct")
+    )
 
-phys_df = load_physical_data("DATA/CFC Physical Capability Data_.csv")
-gradient_df = compute_physical_gradient_df(phys_df)
-max_date = phys_df["testDate"].max()
-min_date = phys_df["testDate"].min()
+# Dropdown index per expression, built once per player and sent to the browser:
+# {expression: {"movements": [options], "qualities": {movement: {"options": [...], "value": default}}}}
+def build_dropdown_index(phys_df):
+    index = {}
+    for expression in ("isometric", "dynamic"):
+        rows = phys_df[phys_df["expression"] == expression]
+        qualities = {}
+        for movement, group in rows.groupby("movement", sort=False):
+            unique_qualities = group["quality"].dropna().unique()
+            default_value = "acceleration" if "acceleration" in unique_qualities else (
+                unique_qualities[0] if len(unique_qualities) > 0 else None
+            )
+            qualities[movement] = {
+                "options": [{"label": q.title(), "value": q} for q in unique_qualities],
+                "value": default_value,
+            }
+        index[expression] = {
+            "movements": [{"label": m.title(), "value": m} for m in rows["movement"].unique()],
+            "qualities": qualities,
+        }
+    return index
+
+def player_dropdown_index(player_id):
+    return data_registry.player_derived("physical", player_id, "dropdown_index", build_dropdown_index)
+
+
+# Benchmark trend figure of one test metric, shared through the figure cache
+def trend_bar_figure(metric_name, selected_range, player_id):
+    return cached_bar_figure(
+        ("physical", "trend", metric_name, data_registry.player_token("physical", player_id)),
+        player_segmenter(player_id), metric_name, selected_range,
+        y_range=[0, None], shapes=[], annotations=[]
+    )
 
-section_ids = ["physical_development_info", "iso_trends", "dyn_trends"]
 
 def render_physical_development(player_id):
+    phys_df = player_physical(player_id)
+    if phys_df.empty:
+        return html.H4("No physical testing data available for this player.", style={"textAlign": "center"})
+    max_date = phys_df["testDate"].max()
+    min_date = phys_df["testDate"].min()
+    dropdown_index = player_dropdown_index(player_id)
+
     return html.Div([
         collapsible_section(
             "Module Guide",
@@ -41,8 +92,7 @@ def render_physical_development(player_id):
             html.Div([
                 dcc.Dropdown(
                     id="iso-movement-dropdown",
-                    options=[{"label": m.title(), "value": m}
-                            for m in phys_df[phys_df["expression"] == "isometric"]["movement"].unique()],
+                    options=dropdown_index["isometric"]["movements"],
                     value="agility",
                     clearable=False,
                     searchable=False,
@@ -60,15 +110,15 @@ def render_physical_development(player_id):
                 "display": "flex", "flexWrap": "wrap", "gap": "10px",
                 "justifyContent": "center", "marginBottom": "10px"
             }),
-            dcc.Graph(id="iso-trend-graph", config={"displayModeBar": False})
+            dcc.Graph(id="iso-trend-graph", config={"displayModeBar": False}),
+            dcc.Store(id="iso-quality-index", data=dropdown_index["isometric"]["qualities"])
         ]), "iso_trends"),
 
         collapsible_section("Dynamic Expression Trends", html.Div([
             html.Div([
                 dcc.Dropdown(
                     id="dyn-movement-dropdown",
-                    options=[{"label": m.title(), "value": m}
-                            for m in phys_df[phys_df["expression"] == "dynamic"]["movement"].unique()],
+                    options=dropdown_index["dynamic"]["movements"],
                     value="agility",
                     clearable=False,
                     searchable=False,
@@ -86,32 +136,32 @@ def render_physical_development(player_id):
                 "display": "flex", "flexWrap": "wrap", "gap": "10px",
                 "justifyContent": "center", "marginBottom": "10px"
             }),
-            dcc.Graph(id="dyn-trend-graph", config={"displayModeBar": False})
+            dcc.Graph(id="dyn-trend-graph", config={"displayModeBar": False}),
+            dcc.Store(id="dyn-quality-index", data=dropdown_index["dynamic"]["qualities"])
         ]), "dyn_trends"),
     ])
 
 
-@callback(
-    Output("reporting-period-physical", "children"),
-    Input("reporting-slider-physical", "value")
+# Reporting period label (and full-series x-ranges) are updated in the browser
+reporting_clientside(
+    "reporting-period-physical", "reporting-slider-physical",
+    windowed_graph_ids=["iso-trend-graph", "dyn-trend-graph"]
 )
-def update_reporting_label(value):
-    start = datetime.fromtimestamp(value[0]).strftime("%d/%m/%Y")
-    end = datetime.fromtimestamp(value[1]).strftime("%d/%m/%Y")
-    return f"Select Report Period: {start} – {end}"
-
 
-@callback(
+@windowed_callback(
+    "reporting-slider-physical",
     Output("physical-demand-output", "children"),
-    Input("reporting-slider-physical", "value")
+    Input("reporting-slider-physical", "value"),
+    State("main-player-id", "data")
 )
-def update_physical_summary(selected_range):
+def update_physical_summary(selected_range, player_id):
+    key = ("physical", "summary", window_key(selected_range), data_registry.player_token("physical", player_id))
+    return figure_cache.get_or_build(key, lambda: physical_summary(selected_range, player_id))
+
+def physical_summary(selected_range, player_id):
     start_date, end_date = map(datetime.fromtimestamp, selected_range)
-    df_filtered = phys_df[
-        (phys_df["testDate"] >= start_date) &
-        (phys_df["testDate"] <= end_date) &
-        (phys_df["benchmarkPct"].notna())
-    ]
+    window_df = date_window(player_physical(player_id), start_date, end_date, date_col="testDate")
+    df_filtered = window_df[window_df["benchmarkPct"].notna()]
 
     return html.Div([
         html.H3("Average Benchmark % Over Reporting Period", style={
@@ -130,118 +180,51 @@ def update_physical_summary(selected_range):
     ])
 
 
-@callback(
-    [Output(f"{section_id}-collapse", "is_open") for section_id in section_ids],
-    [Input(f"{section_id}-toggle", "n_clicks") for section_id in section_ids],
-    [State(f"{section_id}-collapse", "is_open") for section_id in section_ids],
-    prevent_initial_call=True
-)
-def toggle_collapsible(*args):
-    n = len(section_ids)
-    clicks = args[:n]
-    states = args[n:]
-    triggered = ctx.triggered_id
-    return [
-        not state if triggered == f"{section_id}-toggle" else state
-        for section_id, state in zip(section_ids, states)
-    ]
-
-
-
-@callback(
+# Quality options of the selected movement are resolved in the browser
+clientside_callback(
+    ClientsideFunction(namespace="physical", function_name="qualityOptions"),
     Output("iso-quality-dropdown", "options"),
     Output("iso-quality-dropdown", "value"),
-    Input("iso-movement-dropdown", "value")
+    Input("iso-movement-dropdown", "value"),
+    State("iso-quality-index", "data")
 )
-def update_iso_quality_options(selected_movement):
-    filtered = phys_df[
-        (phys_df["expression"] == "isometric") &
-        (phys_df["movement"] == selected_movement)
-    ]
-    unique_qualities = filtered["quality"].dropna().unique()
-    options = [{"label": q.title(), "value": q} for q in unique_qualities]
-    default_value = "acceleration" if "acceleration" in unique_qualities else (
-        unique_qualities[0] if len(unique_qualities) > 0 else None
-    )
-    return options, default_value
 
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace="physical", function_name="qualityOptions"),
     Output("dyn-quality-dropdown", "options"),
     Output("dyn-quality-dropdown", "value"),
-    Input("dyn-movement-dropdown", "value")
+    Input("dyn-movement-dropdown", "value"),
+    State("dyn-quality-index", "data")
 )
-def update_dyn_quality_options(selected_movement):
-    filtered = phys_df[
-        (phys_df["expression"] == "dynamic") &
-        (phys_df["movement"] == selected_movement)
-    ]
-    unique_qualities = filtered["quality"].dropna().unique()
-    options = [{"label": q.title(), "value": q} for q in unique_qualities]
-    default_value = "acceleration" if "acceleration" in unique_qualities else (
-        unique_qualities[0] if len(unique_qualities) > 0 else None
-    )
-    return options, default_value
 
-@callback(
+@windowed_callback(
+    "reporting-slider-physical",
     Output("iso-trend-graph", "figure"),
-    Input("iso_trends-collapse", "is_open"),
+    Input(section_collapse("iso_trends"), "is_open"),
     Input("iso-movement-dropdown", "value"),
     Input("iso-quality-dropdown", "value"),
-    Input("reporting-slider-physical", "value")
+    window_dependency("reporting-slider-physical"),
+    State("main-player-id", "data")
 )
-def update_iso_trend_plot(is_open, movement, quality, selected_range):
+def update_iso_trend_plot(is_open, movement, quality, selected_range, player_id):
     if not is_open:
         return no_update
 
-    start, end = map(datetime.fromtimestamp, selected_range)
-    metric_name = f"isometric_{movement}_{quality}".lower().replace(" ", "_")
-
-    filtered_df = gradient_df[
-        (gradient_df["metric"] == metric_name) &
-        (gradient_df["date"] >= start) &
-        (gradient_df["date"] <= end)
-    ]
-
-    return base_bar_figure(
-        df=filtered_df,
-        metric=metric_name,
-        x_range=[start, end],
-        y_range=[0, None],
-        match_avg=None,
-        training_avg=None,
-        hover_suffix="",
-        shapes=[],
-        annotations=[]
-    )
+    metric_name = physical_metric_key("isometric", movement, quality)
+    return trend_bar_figure(metric_name, selected_range, player_id)
 
-@callback(
+@windowed_callback(
+    "reporting-slider-physical",
     Output("dyn-trend-graph", "figure"),
-    Input("dyn_trends-collapse", "is_open"),
+    Input(section_collapse("dyn_trends"), "is_open"),
     Input("dyn-movement-dropdown", "value"),
     Input("dyn-quality-dropdown", "value"),
-    Input("reporting-slider-physical", "value")
+    window_dependency("reporting-slider-physical"),
+    State("main-player-id", "data")
 )
-def update_dyn_trend_plot(is_open, movement, quality, selected_range):
+def update_dyn_trend_plot(is_open, movement, quality, selected_range, player_id):
     if not is_open:
         return no_update
 
-    start, end = map(datetime.fromtimestamp, selected_range)
-    metric_name = f"dynamic_{movement}_{quality}".lower().replace(" ", "_")
-
-    filtered_df = gradient_df[
-        (gradient_df["metric"] == metric_name) &
-        (gradient_df["date"] >= start) &
-        (gradient_df["date"] <= end)
-    ]
-
-    return base_bar_figure(
-        df=filtered_df,
-        metric=metric_name,
-        x_range=[start, end],
-        y_range=[0, None],
-        match_avg=None,
-        training_avg=None,
-        hover_suffix="",
-        shapes=[],
-        annotations=[]
-    )
+    metric_name = physical_metric_key("dynamic", movement, quality)
+    return trend_bar_figure(metric_name, selected_range, player_id)
@@ -1,24 +1,44 @@
-from utils.data_loader import load_recovery_data, compute_gradient_df, load_gps_data
-from utils.plot_helpers import recovery_radar_chart, emboss_color, base_bar_figure, get_matchday_shapes_annotations
-from utils.components import date_slider, collapsible_section
-import dash_bootstrap_components as dbc
-from datetime import datetime
-from dash import callback, dcc, html, Input, Output
+from utils.data_loader import GradientSegmenter, PLAYER_COL
+from utils import data_registry
+from utils.plot_helpers import recovery_radar_chart, emboss_color
+from utils.components import date_slider, collapsible_section, window_dependency, windowed_callback, reporting_clientside
+from utils.bar_figures import cached_bar_figure, player_overlays
+from dash import dcc, html, Input, Output, State
 import dash_daq as daq
-import plotly.graph_objects as go
-from utils.constants import colors
 
 
-rec_df = load_recovery_data("DATA/CFC Recovery status Data.csv")
-max_date = rec_df["date"].max()
-min_date = rec_df["date"].min()
-metrics = [col for col in rec_df.columns if col != "date"]
-gradient_df = compute_gradient_df(rec_df, metrics)
+metrics = [col for col in data_registry.get("recovery").columns if col not in ("date", PLAYER_COL)]
+
+
+# Per-player data, partitioned and cached by the data registry
+def player_recovery(player_id):
+    return data_registry.player_frame("recovery", player_id)
+
+def player_segmenter(player_id):
+    # Appended sessions are segmented on their own (see data_registry.append)
+    return data_registry.player_derived(
+        "recovery", player_id, "gradient_segmenter", lambda df: GradientSegmenter.from_wide(df, metrics),
+        update=lambda segmenter, rows: segmenter.update_wide(rows, metrics)
+    )
+
+# Gradient bar figure of one recovery metric, shared through the figure cache
+def recovery_bar_figure(metric, selected_range, player_id):
+    key = (
+        "recovery", "bar", metric,
+        data_registry.player_token("recovery", player_id), data_registry.player_token("gps", player_id),
+    )
+    return cached_bar_figure(
+        key, player_segmenter(player_id), metric, selected_range,
+        overlays=player_overlays(player_id), hover_suffix=" %"
+    )
 
-gps_df = load_gps_data("DATA/CFC GPS Data.csv")
-shapes, annotations = get_matchday_shapes_annotations(gps_df)
 
 def render_recovery(player_id):
+    rec_df = player_recovery(player_id)
+    if rec_df.empty:
+        return html.H4("No recovery data available for this player.", style={"textAlign": "center"})
+    max_date = rec_df["date"].max()
+    min_date = rec_df["date"].min()
 
     radar_fig = recovery_radar_chart(rec_df)
     score = rec_df["emboss_baseline_score"].iloc[-1]
@@ -116,138 +136,39 @@ def render_recovery(player_id):
     ], style={"margin": "0 auto"})
 
     
-@callback(
-    Output("reporting-period-recovery", "children"),
-    Input("reporting-slider-recovery", "value")
+# Reporting period label (and full-series x-ranges) are updated in the browser
+reporting_clientside(
+    "reporting-period-recovery", "reporting-slider-recovery",
+    windowed_graph_ids=["composite-trend-graph", "completeness-trend-graph", "overall-recovery-graph"]
 )
-def update_reporting_recovery(value):
-    start = datetime.fromtimestamp(value[0]).strftime("%d/%m/%Y")
-    end = datetime.fromtimestamp(value[1]).strftime("%d/%m/%Y")
-    return f"Select Report Period: {start} – {end}"
-
-@callback(
-    Output("recovery-radar-chart", "figure"),
-    Input("reporting-slider-recovery", "value")
-)
-def update_recovery(selected_range):
-    return recovery_radar_chart(rec_df)
-
 
-@callback(
+@windowed_callback(
+    "reporting-slider-recovery",
     Output("composite-trend-graph", "figure"),
     Input("composite-metric-dropdown", "value"),
-    Input("reporting-slider-recovery", "value")
+    window_dependency("reporting-slider-recovery"),
+    State("main-player-id", "data")
 )
-def update_composite_trend(metric, selected_range):
-    start = datetime.fromtimestamp(selected_range[0])
-    end = datetime.fromtimestamp(selected_range[1])
-    filtered_df = gradient_df[
-        (gradient_df["date"] >= start) & (gradient_df["date"] <= end) & (gradient_df["metric"] == metric)
-    ]
+def update_composite_trend(metric, selected_range, player_id):
+    return recovery_bar_figure(metric, selected_range, player_id)
 
-    return base_bar_figure(
-        df=filtered_df,
-        metric=metric,
-        x_range=[start, end],
-        match_avg=None,
-        training_avg=None,
-        hover_suffix=" %",
-        shapes=shapes,
-        annotations=annotations
-    )
-
-from dash import ctx, State
-
-@callback(
-    Output("composite_trend-collapse", "is_open"),
-    Input("composite_trend-toggle", "n_clicks"),
-    State("composite_trend-collapse", "is_open"),
-    prevent_initial_call=True
-)
-def toggle_composite_section(n, is_open):
-    if n:
-        return not is_open
-    return is_open
 
-
-@callback(
+@windowed_callback(
+    "reporting-slider-recovery",
     Output("completeness-trend-graph", "figure"),
     Input("completeness-metric-dropdown", "value"),
-    Input("reporting-slider-recovery", "value")
-)
-def update_completeness_trend(metric, selected_range):
-    start = datetime.fromtimestamp(selected_range[0])
-    end = datetime.fromtimestamp(selected_range[1])
-    filtered_df = gradient_df[
-        (gradient_df["date"] >= start) & (gradient_df["date"] <= end) & (gradient_df["metric"] == metric)
-    ]
-
-    return base_bar_figure(
-        df=filtered_df,
-        metric=metric,
-        x_range=[start, end],
-        match_avg=None,
-        training_avg=None,
-        hover_suffix=" %",
-        shapes=shapes,
-        annotations=annotations
-    )
-
-from dash import ctx, State
-
-@callback(
-    Output("completeness_trend-collapse", "is_open"),
-    Input("completeness_trend-toggle", "n_clicks"),
-    State("completeness_trend-collapse", "is_open"),
-    prevent_initial_call=True
+    window_dependency("reporting-slider-recovery"),
+    State("main-player-id", "data")
 )
-def toggle_completeness_section(n, is_open):
-    if n:
-        return not is_open
-    return is_open
+def update_completeness_trend(metric, selected_range, player_id):
+    return recovery_bar_figure(metric, selected_range, player_id)
 
-@callback(
+# The player id is an Input so the graph still renders when the slider is only a State
+@windowed_callback(
+    "reporting-slider-recovery",
     Output("overall-recovery-graph", "figure"),
-    Input("reporting-slider-recovery", "value")
-)
-def update_overall_score(selected_range):
-    start = datetime.fromtimestamp(selected_range[0])
-    end = datetime.fromtimestamp(selected_range[1])
-
-    filtered_df = gradient_df[
-        (gradient_df["date"] >= start) & 
-        (gradient_df["date"] <= end) & 
-        (gradient_df["metric"] == "emboss_baseline_score")
-    ]
-
-    return base_bar_figure(
-        df=filtered_df,
-        metric="emboss_baseline_score",
-        x_range=[start, end],
-        hover_suffix=" %",
-        y_range=[None, None],
-        shapes=shapes,
-        annotations=annotations
-    )
-
-@callback(
-    Output("overall_recovery-collapse", "is_open"),
-    Input("overall_recovery-toggle", "n_clicks"),
-    State("overall_recovery-collapse", "is_open"),
-    prevent_initial_call=True
-)
-def toggle_overall_section(n, is_open):
-    if n:
-        return not is_open
-    return is_open
-
-@callback(
-    Output("recovery_info-collapse", "is_open"),
-    Input("recovery_info-toggle", "n_clicks"),
-    State("recovery_info-collapse", "is_open"),
-    prevent_initial_call=True
+    window_dependency("reporting-slider-recovery"),
+    Input("main-player-id", "data")
 )
-def toggle_recovery_info(n, is_open):
-    if n:
-        return not is_open
-    return is_open
+def update_overall_score(selected_range, player_id):
+    return recovery_bar_figure("emboss_baseline_score", selected_range, player_id)
@@ -1,10 +1,9 @@
 from dash import dcc, html, Input, Output, callback
-import json
 from pages.player_card import render_player_cards_by_position
+from utils import data_registry
 
 # Load pre-fetched structured squad data from your JSON file
-with open("DATA/players.json") as f:
-    squad_data = json.load(f)
+squad_data = data_registry.get("players")
 
 layout = html.Div([
     dcc.Tabs(id="squad-type-tabs", value="MySquads", mobile_breakpoint=0, children=[
@@ -0,0 +1,62 @@
+"""
+Local stand-in for the API-Football endpoints, shared by the API client tests
+and benchmarks/bench_fetch_players.py.
+
+StubApi replays canned responses - a dict mapping canned_key(endpoint, params)
+to payloads, unknown requests get an empty response - after a fixed latency,
+and can fail a share of requests with 429/500 to exercise the client's retries.
+Point an ApiClient at `server.url` once serve_forever() is running.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+def canned_key(endpoint, params):
+    return endpoint + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+
+class StubApi(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, canned, latency=0.0, fail_rate=0.0, seed=0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.canned = canned
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        key = canned_key(url.path.strip("/"), dict(parse_qsl(url.query)))
+        with server.lock:
+            server.requests += 1
+            fail = server.random.random() < server.fail_rate
+            status = server.random.choice([429, 500]) if fail else 200
+            server.failures += fail
+        time.sleep(server.latency)
+
+        payload = {"errors": [], "response": []} if status != 200 else server.canned.get(key, {"errors": [], "response": []})
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", "6000")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
@@ -0,0 +1,32 @@
+import threading
+
+from DATA.api_client import ApiClient, ResponseCache
+from tests.stub_api import StubApi
+
+
+def serve(canned):
+    server = StubApi(canned)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_cache_entries_are_not_shared_between_servers(tmp_path):
+    servers = [
+        serve({"teams?id=49": {"errors": [], "response": [{"team": {"id": 49, "name": name}}]}})
+        for name in ("Stub", "Chelsea")
+    ]
+    try:
+        names = []
+        for _ in range(2):
+            for server in servers:
+                cache = ResponseCache(str(tmp_path))
+                with ApiClient("key", base_url=server.url, cache=cache) as client:
+                    names.append(client.get("teams", id=49)["response"][0]["team"]["name"])
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+    assert names == ["Stub", "Chelsea", "Stub", "Chelsea"]
+    # The second round is served from the cache, one entry per server
+    assert [server.requests for server in servers] == [1, 1]
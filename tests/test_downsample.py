@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from utils.downsample import point_budget, window_indices
+
+
+def daily_series(days, seed=0):
+    dates = pd.date_range("2019-07-01", periods=days, freq="D")
+    values = np.random.default_rng(seed).normal(1.0, 0.3, days)
+    return dates, values
+
+
+def test_short_history_is_kept_whole():
+    dates, values = daily_series(300)
+    kept = window_indices(dates, values, dates[100], dates[142], point_budget(width_px=200))
+    np.testing.assert_array_equal(kept, np.arange(300))
+
+
+def test_long_history_is_downsampled():
+    # Six seasons of daily rows, shown through a six-week window
+    dates, values = daily_series(6 * 365)
+    n_out = point_budget(width_px=400)
+    start, end = dates[1000], dates[1042]
+    for method in ("lttb", "minmax"):
+        kept = window_indices(dates, values, start, end, n_out, method)
+        assert len(kept) < len(dates)
+        assert len(kept) <= 2 * n_out + 4
+        assert np.all(np.diff(kept) > 0)
+        assert kept[0] == 0 and kept[-1] == len(dates) - 1
+        # The visible window is within budget, so all of its rows survive
+        assert set(range(999, 1044)) <= set(kept)
+
+
+def test_budget_does_not_grow_with_history():
+    n_out = point_budget(width_px=100)
+    sizes = []
+    for days in (2 * 365, 6 * 365, 20 * 365):
+        dates, values = daily_series(days)
+        sizes.append(len(window_indices(dates, values, dates[-42], dates[-1], n_out)))
+    assert max(sizes) <= 2 * n_out + 4
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import GradientSegmenter, physical_metric_frame
+
+
+def physical_rows(benchmarks):
+    return pd.DataFrame({
+        "testDate": pd.date_range("2024-01-01", periods=len(benchmarks), freq="W"),
+        "expression": "isometric",
+        "movement": "agility",
+        "quality": "rotate",
+        "benchmarkPct": benchmarks,
+    })
+
+
+def test_physical_bars_are_scaled_by_the_metric_range():
+    segmenter = GradientSegmenter.from_long(
+        physical_metric_frame(physical_rows([0.6, -0.15, 0.3, np.nan])), value_col="benchmarkPct", max_segments=30
+    )
+    segments = segmenter.segments("isometric_agility_rotate")
+    bars = {total: group for total, group in segments.groupby("total")}
+    assert sorted(bars) == [-0.15, 0.3, 0.6]
+
+    top = bars[0.6]
+    assert len(top) == 30 and (top["color_scale"] == "Blues").all()
+    np.testing.assert_allclose(top["height"], 0.02)
+    assert np.isclose(top["color_val"].max(), 1.0)
+
+
+def test_negative_physical_benchmarks_are_full_downward_bars():
+    # A negative benchmark is stacked down from zero in steps of |min| / 30,
+    # not drawn as one remainder segment below zero
+    segmenter = GradientSegmenter.from_long(
+        physical_metric_frame(physical_rows([0.6, -0.15, -0.05])), value_col="benchmarkPct", max_segments=30
+    )
+    segments = segmenter.segments("isometric_agility_rotate")
+
+    lowest = segments[segments["total"] == -0.15]
+    assert len(lowest) == 30 and (lowest["color_scale"] == "Oranges").all()
+    np.testing.assert_allclose(lowest["height"], -0.005)
+    np.testing.assert_allclose(lowest["base"].iloc[0], 0.0)
+    np.testing.assert_allclose((lowest["base"] + lowest["height"]).min(), -0.15)
+
+    shallow = segments[segments["total"] == -0.05]
+    np.testing.assert_allclose(shallow["base"].iloc[0], 0.0)
+    np.testing.assert_allclose(shallow["height"].sum(), -0.05)
+    assert np.isclose(shallow["color_val"].max(), 1 / 3)
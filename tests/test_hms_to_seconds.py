@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_loader import hms_to_seconds
+
+
+def test_durations_are_parsed_to_whole_seconds():
+    seconds, malformed = hms_to_seconds(pd.Series(["00:00:00", "01:02:03", "1:05:00", "100:00:00"]))
+    assert seconds.tolist() == [0, 3723, 3900, 360000]
+    assert seconds.dtype == np.int64
+    assert not malformed.any()
+
+
+@pytest.mark.parametrize("value", ["-1:00:00", "+1:00:00", "00:-5:00", "1.5:00:00", "1:00", "1:00:00:00", "ab:cd:ef", 3600])
+def test_malformed_durations_become_nan(value):
+    seconds, malformed = hms_to_seconds(pd.Series(["00:10:00", value]))
+    assert seconds.iloc[0] == 600
+    assert np.isnan(seconds.iloc[1])
+    assert malformed.tolist() == [False, True]
+
+
+def test_only_columns_with_malformed_cells_become_float():
+    frame = pd.DataFrame({
+        "hr_zone_1_hms": ["00:01:00", "00:02:00"],
+        "hr_zone_2_hms": ["00:03:00", "-0:04:00"],
+        "hr_zone_3_hms": ["0:05:00", "00:06:00"],
+    })
+    seconds, malformed = hms_to_seconds(frame)
+    assert seconds.dtypes.to_dict() == {
+        "hr_zone_1_hms": np.int64, "hr_zone_2_hms": np.float64, "hr_zone_3_hms": np.int64
+    }
+    assert seconds["hr_zone_3_hms"].tolist() == [300, 360]
+    assert malformed.to_numpy().sum() == 1
+
+
+def test_empty_frame():
+    seconds, malformed = hms_to_seconds(pd.DataFrame({"hr_zone_1_hms": pd.Series(dtype=object)}))
+    assert seconds.empty and malformed.empty
+    assert list(seconds.columns) == ["hr_zone_1_hms"]
@@ -0,0 +1,43 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+SCRIPT = os.path.join(os.path.dirname(__file__), os.pardir, "assets", "js", "reporting.js")
+
+# 2024-03-01 and 2024-03-29 at UTC midnight, as the reporting sliders send them
+WINDOW = [1709251200, 1711670400]
+
+
+def run_reporting(expression, timezone):
+    """Evaluate `expression` against window.dash_clientside.reporting in node, in `timezone`."""
+    if shutil.which("node") is None:
+        pytest.skip("node is not installed")
+    program = f"""
+        const fs = require("fs");
+        const vm = require("vm");
+        const window = {{dash_clientside: {{no_update: null}}}};
+        vm.runInNewContext(fs.readFileSync({json.dumps(SCRIPT)}, "utf8"), {{window, setTimeout, clearTimeout}});
+        const reporting = window.dash_clientside.reporting;
+        console.log(JSON.stringify({expression}));
+    """
+    result = subprocess.run(
+        ["node", "-e", program], env=dict(os.environ, TZ=timezone), capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "America/New_York", "Pacific/Auckland"])
+def test_label_shows_slider_dates_in_any_timezone(timezone):
+    label = run_reporting(f"reporting.label({WINDOW})", timezone)
+    assert label == "Select Report Period: 01/03/2024 – 29/03/2024"
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "America/New_York", "Pacific/Auckland"])
+def test_x_range_matches_slider_dates_in_any_timezone(timezone):
+    figure = run_reporting(f"reporting.xRange({WINDOW}, {{layout: {{xaxis: {{title: 'Date'}}}}}})", timezone)
+    assert figure["layout"]["xaxis"] == {
+        "title": "Date", "range": ["2024-03-01 00:00:00", "2024-03-29 00:00:00"], "autorange": False
+    }
@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+from dash.exceptions import PreventUpdate
+
+from utils.request_coalescer import RequestCoalescer
+
+
+def test_burst_builds_only_the_final_request():
+    coalescer = RequestCoalescer(settle_seconds=0.1)
+    built, results = [], {}
+
+    def request(window):
+        try:
+            results[window] = coalescer.run(("client", "render"), lambda: built.append(window) or window)
+        except PreventUpdate:
+            results[window] = None
+
+    threads = []
+    for window in range(5):
+        threads.append(threading.Thread(target=request, args=(window,)))
+        threads[-1].start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+    assert built == [4]
+    assert results == {0: None, 1: None, 2: None, 3: None, 4: 4}
+    assert coalescer.dropped == 4
+
+
+def test_other_keys_are_not_superseded():
+    coalescer = RequestCoalescer(settle_seconds=0.0)
+    assert coalescer.run(("a", "render"), lambda: 1) == 1
+    assert coalescer.run(("b", "render"), lambda: 2) == 2
+
+
+def test_request_superseded_while_building_is_dropped():
+    coalescer = RequestCoalescer(settle_seconds=0.0)
+
+    def build():
+        coalescer.run(("client", "render"), lambda: "newer")
+        return "older"
+
+    with pytest.raises(PreventUpdate):
+        coalescer.run(("client", "render"), build)
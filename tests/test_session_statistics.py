@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import SESSION_PERCENTILES, session_statistics
+
+METRICS = ["distance", "peak_speed"]
+STATISTICS = ["mean", "median", "std", *(name for name, _ in SESSION_PERCENTILES)]
+
+
+def sessions(match, training):
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=len(match)),
+        "season": "2023/2024",
+        "is_match_day": match,
+        "is_training_day": training,
+        "distance": np.arange(len(match), dtype=float) * 1000,
+        "peak_speed": np.linspace(25, 32, len(match)),
+    })
+
+
+def test_statistics_per_session_type():
+    df = sessions([True, False, False, True, False], [False, True, True, False, False])
+    table = session_statistics(df, METRICS)
+    assert list(table.index) == ["Match", "Training"]
+    assert table.at["Match", ("distance", "mean")] == 1500
+    assert table.at["Training", ("distance", "median")] == 1500
+
+
+def test_no_sessions_gives_an_empty_table():
+    rest_days = sessions([False, False], [False, False])
+    for df in (rest_days, rest_days.iloc[:0]):
+        table = session_statistics(df, METRICS)
+        assert table.empty
+        assert table.index.name == "session_type"
+        assert list(table.columns) == list(pd.MultiIndex.from_product([METRICS, STATISTICS]))
+
+        by_season = session_statistics(df, METRICS, by=("season",))
+        assert by_season.empty
+        assert list(by_season.index.names) == ["season", "session_type"]
+
+
+def test_missing_session_type_keeps_all_columns():
+    table = session_statistics(sessions([True, True], [False, False]), METRICS)
+    assert list(table.index) == ["Match"]
+    assert list(table.columns) == list(pd.MultiIndex.from_product([METRICS, STATISTICS]))
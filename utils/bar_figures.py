@@ -0,0 +1,38 @@
+"""
+Gradient bar figures shared by the load demand, recovery and physical pages.
+
+Each page keys its charts on its own data (data_registry.player_token) and
+dropdown values; cached_bar_figure() adds the slider window, picks the bars to
+send - the window's, or the full history when the browser re-windows the
+chart (FULL_SERIES), as segments or one row per bar (COMPACT_BARS) - and
+builds the figure once through figure_cache.
+"""
+from datetime import datetime
+
+from utils import data_registry
+from utils.components import FULL_SERIES, COMPACT_BARS
+from utils.figure_cache import figure_cache, window_key
+from utils.plot_helpers import base_bar_figure, MatchdayOverlays
+
+
+def player_overlays(player_id):
+    """Match-day lines and labels of a player's GPS history."""
+    return data_registry.player_derived("gps", player_id, "matchday_overlays", MatchdayOverlays)
+
+
+def cached_bar_figure(key, segmenter, metric, selected_range, overlays=None, **figure_kwargs):
+    """
+    base_bar_figure of `metric` from a GradientSegmenter for the slider window
+    `selected_range`, cached under `key` plus the window. With `overlays` (a
+    MatchdayOverlays) the window's match days are drawn as well; other keyword
+    arguments are passed on to base_bar_figure.
+    """
+    def build():
+        start, end = map(datetime.fromtimestamp, selected_range)
+        window = (None, None) if FULL_SERIES else (start, end)
+        bars = (segmenter.bars if COMPACT_BARS else segmenter.segments)(metric, *window)
+        if overlays is not None:
+            figure_kwargs["shapes"], figure_kwargs["annotations"] = overlays.window(*window)
+        return base_bar_figure(bars, metric, [start, end], compact=COMPACT_BARS, **figure_kwargs)
+
+    return figure_cache.get_or_build((*key, window_key(selected_range)), build)
@@ -1,14 +1,48 @@
 import dash_bootstrap_components as dbc
-from dash import html, dcc, Input, Output, callback
+from dash import html, dcc, Input, Output, State, MATCH, callback, clientside_callback, ClientsideFunction, ctx
 import pandas as pd
-from datetime import datetime, timedelta
+import json
+import os
+import uuid
+from datetime import timedelta
+from utils.request_coalescer import coalescer
+
+# Send windowed bar charts once with their full history and let the browser
+# apply the reporting window, instead of rebuilding them on every slider move
+FULL_SERIES = os.environ.get("CFC_FULL_SERIES", "") == "1"
+
+# Draw gradient bars as one filled outline per bar with a browser-side colour
+# gradient, instead of one stacked bar per gradient segment
+COMPACT_BARS = os.environ.get("CFC_COMPACT_BARS", "") == "1"
+
+# Sliders commit their window on release ("mouseup") or continuously ("drag");
+# SLIDER_IDLE_MS > 0 also commits a held drag once it has been still that long (off by
+# default: each pause in a drag then costs a request on top of the release)
+SLIDER_UPDATEMODE = os.environ.get("CFC_SLIDER_UPDATEMODE", "mouseup")
+SLIDER_IDLE_MS = int(os.environ.get("CFC_SLIDER_IDLE_MS", 0))
+
+def section_toggle(section_id):
+    """Pattern-matching id of a collapsible section's toggle button."""
+    return {"type": "section-toggle", "index": section_id}
+
+
+def section_collapse(section_id):
+    """Pattern-matching id of a collapsible section's dbc.Collapse."""
+    return {"type": "section-collapse", "index": section_id}
+
+
+def section_open_prop(section_id):
+    """The section's `is_open` prop id as it appears in ctx.triggered_prop_ids."""
+    collapse_id = section_collapse(section_id)
+    return "{" + ",".join(f"{json.dumps(k)}:{json.dumps(collapse_id[k])}" for k in sorted(collapse_id)) + "}.is_open"
+
 
 def collapsible_section(title, content, section_id):
     return html.Div([
         html.Div(
             dbc.Button(
                 title,
-                id=f"{section_id}-toggle",
+                id=section_toggle(section_id),
                 className="mb-2",
                 color="white",
                 style={"width": "90%", "letterSpacing": "1px"}
@@ -20,21 +54,34 @@ def collapsible_section(title, content, section_id):
                 content,
                 style={"maxWidth": "90%", "margin": "0 auto"}
             ),
-            id=f"{section_id}-collapse",
+            id=section_collapse(section_id),
             is_open=False
         )
     ], style={"marginBottom": "20px"})
 
 
+# Every collapsible section toggles itself in the browser
+clientside_callback(
+    "(n, isOpen) => n ? !isOpen : isOpen",
+    Output(section_collapse(MATCH), "is_open"),
+    Input(section_toggle(MATCH), "n_clicks"),
+    State(section_collapse(MATCH), "is_open"),
+    prevent_initial_call=True
+)
+
+
 def date_slider(
     label_id,
     slider_id,
     min_date,
     max_date,
     initial_weeks=6,
-    output_id="load-demand-output"
+    output_id="load-demand-output",
+    updatemode=None
 ):
     return html.Div([
+        # Identifies this rendering of the slider to the request coalescer
+        dcc.Store(id=f"{slider_id}-client", data=uuid.uuid4().hex),
         html.Div([
             html.H2(id=label_id, style={
                 "fontWeight": "light",
@@ -48,6 +95,7 @@ def date_slider(
                 min=int(min_date.timestamp()),
                 max=int(max_date.timestamp()),
                 step=7 * 24 * 60 * 60,  # weekly steps
+                updatemode=updatemode or SLIDER_UPDATEMODE,
                 value=[
                     int((max_date - timedelta(weeks=initial_weeks)).timestamp()),
                     int(max_date.timestamp())
@@ -79,6 +127,62 @@ def date_slider(
     ], style={"textAlign": "center", "marginBottom": "30px"})
 
 
+def window_dependency(slider_id):
+    """
+    Slider dependency of a windowed bar chart: an Input that rebuilds the figure
+    per window, or a State in full-series mode where the browser re-windows it.
+    """
+    return State(slider_id, "value") if FULL_SERIES else Input(slider_id, "value")
+
+
+def windowed_callback(slider_id, *dependencies, **kwargs):
+    """
+    Register a callback that depends on the window of `slider_id`, dropping
+    requests superseded by a newer request with the same triggering inputs from
+    the same client. The decorated function is returned unchanged so it can
+    still be called directly.
+    """
+    def decorator(func):
+        def coalesced(*args):
+            *args, client = args
+            key = (client, func.__name__, tuple(sorted(ctx.triggered_prop_ids)))
+            return coalescer.run(key, lambda: func(*args))
+
+        callback(*dependencies, State(f"{slider_id}-client", "data"), **kwargs)(coalesced)
+        return func
+    return decorator
+
+
+def reporting_clientside(label_id, slider_id, graph_ids=(), windowed_graph_ids=()):
+    """
+    Register the browser-side slider callbacks of a page: the reporting-period
+    label, x-axis updates for `graph_ids` (figures that always carry their full
+    series) plus `windowed_graph_ids` when FULL_SERIES is enabled, and the
+    idle-time commit of dragged windows when SLIDER_IDLE_MS is set.
+    """
+    if SLIDER_IDLE_MS > 0:
+        clientside_callback(
+            f"(drag, value) => window.dash_clientside.reporting.commitIdle(drag, value, {SLIDER_IDLE_MS})",
+            Output(slider_id, "value"),
+            Input(slider_id, "drag_value"),
+            Input(slider_id, "value"),
+            prevent_initial_call=True
+        )
+    clientside_callback(
+        ClientsideFunction(namespace="reporting", function_name="label"),
+        Output(label_id, "children"),
+        Input(slider_id, "value")
+    )
+    for graph_id in list(graph_ids) + (list(windowed_graph_ids) if FULL_SERIES else []):
+        clientside_callback(
+            ClientsideFunction(namespace="reporting", function_name="xRange"),
+            Output(graph_id, "figure", allow_duplicate=True),
+            Input(slider_id, "value"),
+            State(graph_id, "figure"),
+            prevent_initial_call=True
+        )
+
+
 def create_fixture_cards(fixtures):
     return html.Div([
         html.Div([
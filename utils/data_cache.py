@@ -0,0 +1,87 @@
+"""
+Optional on-disk cache of the preprocessed dataset frames.
+
+Loading a CSV means latin-1 decoding, date parsing, heart-rate zone parsing and
+(for recovery) a pivot on every process start. When enabled, the cleaned frame
+returned by a loader is written once to a Feather (Arrow IPC) file next to a
+small JSON manifest recording the source file's size and modification time.
+Later starts memory-map the Feather file instead of re-parsing, and the entry
+is rebuilt automatically whenever the source CSV changes.
+
+Requires pyarrow; without it the cache is silently bypassed.
+"""
+import json
+import os
+
+import numpy as np
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional dependency
+    feather = None
+
+CACHE_VERSION = 1
+
+
+def available():
+    return feather is not None
+
+
+def _source_stamp(path, loader):
+    stat = os.stat(path)
+    return {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "loader": f"{loader.__module__}.{loader.__qualname__}",
+    }
+
+
+def _entry_paths(cache_dir, name):
+    return os.path.join(cache_dir, f"{name}.feather"), os.path.join(cache_dir, f"{name}.json")
+
+
+def _read(data_path):
+    df = feather.read_table(data_path, memory_map=True).to_pandas()
+    # Arrow stores missing strings as None; restore the NaN the CSV parser produces
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def _write(df, data_path, manifest_path, stamp):
+    tmp_data, tmp_manifest = f"{data_path}.tmp", f"{manifest_path}.tmp"
+    feather.write_feather(df.reset_index(drop=True), tmp_data, compression="uncompressed")
+    with open(tmp_manifest, "w") as f:
+        json.dump({**stamp, "attrs": df.attrs}, f, default=str)
+    os.replace(tmp_data, data_path)
+    os.replace(tmp_manifest, manifest_path)
+
+
+def cached_load(name, loader, path, cache_dir):
+    """
+    Return (frame, source) for loader(path), where source is "cache" when the
+    frame came from a fresh cache entry and "source" when it was (re)built from
+    the source file - the same labels as data_registry.load_timings().
+    """
+    if not available():
+        return loader(path), "source"
+
+    data_path, manifest_path = _entry_paths(cache_dir, name)
+    stamp = _source_stamp(path, loader)
+
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if {k: manifest.get(k) for k in stamp} == stamp and os.path.exists(data_path):
+            df = _read(data_path)
+            df.attrs.update(manifest.get("attrs", {}))
+            return df, "cache"
+    except (OSError, ValueError):
+        pass
+
+    df = loader(path)
+    os.makedirs(cache_dir, exist_ok=True)
+    _write(df, data_path, manifest_path, stamp)
+    return df, "source"
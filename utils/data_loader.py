@@ -1,19 +1,83 @@
 import json
+import threading
+import warnings
+from collections import OrderedDict
+
 import pandas as pd
 import numpy as np
 
+# Column identifying the athlete in squad-wide exports
+PLAYER_COL = "player_id"
+
+
+def normalise_player_ids(df):
+    # Player ids are compared as strings (matching players.json / the URL)
+    if PLAYER_COL in df.columns:
+        ids = df[PLAYER_COL]
+        if pd.api.types.is_float_dtype(ids):
+            ids = ids.astype("Int64")
+        df[PLAYER_COL] = ids.astype(str)
+    return df
+
+
+def partition_by_player(df, date_col="date"):
+    """
+    Split a squad-wide frame into date-sorted per-player frames keyed by player id.
+
+    Single-athlete exports (no player column) become one partition keyed None.
+    """
+    df = df.sort_values(date_col, kind="stable", ignore_index=True)
+    if PLAYER_COL not in df.columns:
+        return {None: with_date_index(df, date_col)}
+    return {
+        player_id: with_date_index(group, date_col)
+        for player_id, group in df.groupby(PLAYER_COL, sort=False)
+    }
+
+
+def with_date_index(df, date_col="date"):
+    # Unnamed so "date" stays unambiguous as a column label
+    return df.set_axis(pd.DatetimeIndex(df[date_col].to_numpy()))
+
+
+def date_window(df, start=None, end=None, date_col="date"):
+    """
+    Return the rows of `df` dated within [start, end].
+
+    Frames with a sorted DatetimeIndex (see partition_by_player) are sliced by
+    binary search, costing O(log n) plus the size of the window; anything else
+    falls back to a boolean mask on `date_col`.
+    """
+    index = df.index
+    if isinstance(index, pd.DatetimeIndex) and index.is_monotonic_increasing:
+        lo = index.searchsorted(pd.Timestamp(start), side="left") if start is not None else 0
+        hi = index.searchsorted(pd.Timestamp(end), side="right") if end is not None else len(index)
+        return df.iloc[lo:hi]
+
+    in_window = pd.Series(True, index=index)
+    if start is not None:
+        in_window &= df[date_col] >= start
+    if end is not None:
+        in_window &= df[date_col] <= end
+    return df[in_window]
+
+
+def load_json(json_path):
+    with open(json_path) as f:
+        return json.load(f)
+
+
 def load_fixtures(json_path):
     # Load fixtures from JSON
-    with open("DATA/fixtures.json") as f:
-        fixtures = json.load(f)
-    
-    return fixtures
+    return load_json(json_path)
 
 
 def load_player_data(json_path):
-    with open(json_path) as f:
-        data = json.load(f)
+    return build_player_lookup(load_json(json_path))
 
+
+def build_player_lookup(data):
+    # Flatten Chelsea and opposition squads into {player_id: player}
     player_lookup = {}
     for group in ["chelsea_squads", "opposition"]:
         for squad in data[group]:
@@ -26,9 +90,109 @@ def load_player_data(json_path):
     return player_lookup
 
 
+# Radar stats that are already rates rather than season totals
+RADAR_RATE_STATS = ("Pass Accuracy", "Av. Rating")
+
+
+def per_90(player):
+    """A player's radar stats per 90 minutes (rates such as pass accuracy as they are)."""
+    mins = player.get("minutes", 1) or 1
+    return {
+        k: (v / mins * 90 if k not in RADAR_RATE_STATS else v)
+        for k, v in player.get("radar", {}).items()
+    }
+
+
+class RadarStats:
+    """
+    Per-90 radar stats of every player, as one matrix per position (a row per
+    player, a column per stat) with the position's maxima, the rows normalised
+    by them and each value's percentile rank within the position. Built once
+    from the player lookup; missing stats count as 0.
+    """
+
+    def __init__(self, player_lookup):
+        by_position = {}
+        for player_id, player in player_lookup.items():
+            by_position.setdefault(player.get("position"), []).append((player_id, player))
+
+        self._rows = {}
+        self._positions = {}
+        for position, players in by_position.items():
+            keys = list(dict.fromkeys(k for _, p in players for k in p.get("radar", {})))
+            column = {k: i for i, k in enumerate(keys)}
+            matrix = np.zeros((len(players), len(keys)))
+            for row, (player_id, player) in enumerate(players):
+                for k, v in per_90(player).items():
+                    matrix[row, column[k]] = v
+                self._rows[player_id] = (position, row)
+
+            maxima = np.maximum(matrix.max(axis=0, initial=0), 0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                normalised = np.where(maxima > 0, matrix / maxima, 0.0)
+            # Share of the position's players at or below each value
+            ranks = np.empty_like(matrix)
+            for i in range(len(keys)):
+                ordered = np.sort(matrix[:, i])
+                ranks[:, i] = np.searchsorted(ordered, matrix[:, i], side="right") / len(players) * 100
+
+            self._positions[position] = {
+                "keys": keys,
+                "column": column,
+                "matrix": matrix,
+                "maxima": maxima,
+                "normalised": normalised,
+                "ranks": ranks,
+                "options": [
+                    {"label": f"{p['name']} ({p['position']})", "value": str(p["id"])} for _, p in players
+                ],
+            }
+
+    def position(self, player_id):
+        return self._rows[str(player_id)][0]
+
+    def comparison_options(self, position):
+        """Dropdown options for every player in `position`, in player lookup order."""
+        stats = self._positions.get(position)
+        return stats["options"] if stats else []
+
+    def maxima(self, position):
+        stats = self._positions[position]
+        return dict(zip(stats["keys"], stats["maxima"]))
+
+    def _lookup(self, player_id, keys, table):
+        position, row = self._rows[str(player_id)]
+        stats = self._positions[position]
+        return [stats[table][row, stats["column"][k]] for k in keys]
+
+    def values(self, player_id, keys):
+        """Per-90 values of one player's `keys`."""
+        return self._lookup(player_id, keys, "matrix")
+
+    def percentiles(self, player_id, keys):
+        """Percentile ranks (0-100) of one player's `keys` within their position."""
+        return self._lookup(player_id, keys, "ranks")
+
+    def normalised(self, player_id, keys, position=None):
+        """
+        One player's `keys` scaled by the maxima of `position` (their own by
+        default - a row lookup). Stats the position lacks are scaled by 1.
+        """
+        own_position, row = self._rows[str(player_id)]
+        if position is None or position == own_position:
+            stats = self._positions[own_position]
+            return [stats["normalised"][row, stats["column"][k]] for k in keys]
+        maxima = self.maxima(position) if position in self._positions else {}
+        return [
+            value / maxima.get(k, 1) if maxima.get(k, 1) else 0.0
+            for k, value in zip(keys, self.values(player_id, keys))
+        ]
+
+
 def load_gps_data(csv_path):
     df = pd.read_csv(csv_path, encoding="latin-1")
     df["date"] = pd.to_datetime(df["date"], format="%d/%m/%Y")
+    df = normalise_player_ids(df)
 
     # Create match/training day flags
     df["is_training_day"] = (df["day_duration"] > 0) & (df["md_plus_code"] != 0)
@@ -37,196 +201,627 @@ def load_gps_data(csv_path):
     # Distance per minute
     df["distance_per_min"] = df["distance"] / df["day_duration"].where(df["day_duration"] > 0)
 
-    # Heart rate time in seconds
-    def hms_to_seconds(hms):
-        try:
-            h, m, s = map(int, hms.split(":"))
-            return h * 3600 + m * 60 + s
-        except:
-            return 0
+    # Heart rate time in seconds (missing values count as no time in zone)
+    hms_cols = [f"hr_zone_{i}_hms" for i in range(1, 6)]
+    seconds, malformed = hms_to_seconds(df[hms_cols].fillna("00:00:00"))
+    for i, col in enumerate(hms_cols, start=1):
+        df[f"hr_zone_{i}_sec"] = seconds[col]
 
-    for i in range(1, 6):
-        col = f"hr_zone_{i}_hms"
-        df[f"hr_zone_{i}_sec"] = df[col].fillna("00:00:00").apply(hms_to_seconds)
+    df.attrs["hr_zone_malformed"] = {col: int(n) for col, n in malformed.sum().items() if n}
+    if df.attrs["hr_zone_malformed"]:
+        warnings.warn(
+            f"{csv_path}: {int(malformed.to_numpy().sum())} malformed heart rate zone durations "
+            f"set to NaN {df.attrs['hr_zone_malformed']}",
+            stacklevel=2
+        )
 
     return df
 
 
+# Percentiles reported by session_statistics, as (column name, quantile)
+SESSION_PERCENTILES = [("p10", 0.10), ("p25", 0.25), ("p75", 0.75), ("p90", 0.90)]
+
+
+def session_statistics(df, metrics, by=()):
+    """
+    Summary statistics of each metric over match and training sessions.
+
+    Rest days (no recorded duration) are left out, as in the is_match_day /
+    is_training_day flags. Pass extra grouping columns in `by`, e.g.
+    ("season",) or (PLAYER_COL,), to split the table further.
+
+    Returns:
+        pd.DataFrame: One row per (*by, session type) - session types are
+        "Match" and "Training" - with (metric, statistic) columns for the
+        mean, median, std and the SESSION_PERCENTILES; no rows if there are
+        no sessions
+    """
+    columns = pd.MultiIndex.from_product(
+        [metrics, ["mean", "median", "std", *(name for name, _ in SESSION_PERCENTILES)]]
+    )
+    sessions = df[df["is_match_day"] | df["is_training_day"]]
+    if sessions.empty:
+        names = [*by, "session_type"]
+        index = pd.MultiIndex.from_arrays([[]] * len(names), names=names) if by else pd.Index([], name="session_type")
+        return pd.DataFrame(index=index, columns=columns, dtype=float)
+
+    session_type = sessions["is_match_day"].map({True: "Match", False: "Training"}).rename("session_type")
+    grouped = sessions[metrics].apply(pd.to_numeric, errors="coerce").groupby([*(sessions[c] for c in by), session_type])
+
+    summary = grouped.agg(["mean", "median", "std"])
+    percentiles = grouped.quantile([q for _, q in SESSION_PERCENTILES]).unstack()
+    percentiles = percentiles.rename(columns=dict((q, name) for name, q in SESSION_PERCENTILES), level=1)
+    return pd.concat([summary, percentiles], axis=1).reindex(columns=columns)
+
+
+def hms_to_seconds(values):
+    """
+    Convert "HH:MM:SS" duration strings to whole seconds.
+
+    Parameters:
+        values (pd.DataFrame or pd.Series): Duration strings
+
+    Returns:
+        tuple: (seconds, malformed) with the same shape as `values`. Anything
+        that is not three unsigned integer fields separated by colons (e.g.
+        "-1:00:00") is malformed and becomes NaN in `seconds`; columns without
+        malformed cells keep an integer dtype.
+    """
+    frame = values.to_frame() if isinstance(values, pd.Series) else values
+    flat = frame.to_numpy(dtype=object).ravel()
+
+    # Fast path for the fixed-width "HH:MM:SS" layout, general parser for the rest
+    seconds, parsed = _parse_fixed_width_hms(flat)
+    malformed = ~parsed
+    if malformed.any():
+        seconds = seconds.astype(float)
+        seconds[malformed], malformed[malformed] = _parse_general_hms(flat[malformed])
+    if malformed.any():
+        seconds[malformed] = np.nan
+
+    seconds, malformed = seconds.reshape(frame.shape), malformed.reshape(frame.shape)
+    # Only columns that actually hold a NaN become float
+    seconds = pd.DataFrame({
+        col: seconds[:, j] if malformed[:, j].any() else seconds[:, j].astype(np.int64)
+        for j, col in enumerate(frame.columns)
+    }, index=frame.index)
+    malformed = pd.DataFrame(malformed, index=frame.index, columns=frame.columns)
+    if isinstance(values, pd.Series):
+        return seconds.iloc[:, 0], malformed.iloc[:, 0]
+    return seconds, malformed
+
+
+def _parse_fixed_width_hms(flat):
+    # Read the digits of "HH:MM:SS" straight from the ASCII bytes
+    seconds = np.zeros(flat.size, dtype=np.int64)
+    try:
+        raw = flat.astype("S")
+    except UnicodeEncodeError:
+        return seconds, np.zeros(flat.size, dtype=bool)
+    if raw.itemsize < 8:
+        return seconds, np.zeros(flat.size, dtype=bool)
+
+    chars = raw.view(np.uint8).reshape(flat.size, raw.itemsize)
+    digits = chars[:, [0, 1, 3, 4, 6, 7]] - np.uint8(ord("0"))
+    parsed = (chars[:, 2] == ord(":")) & (chars[:, 5] == ord(":")) & (digits <= 9).all(axis=1)
+    parsed &= (chars[:, 8:] == 0).all(axis=1)
+
+    digits = digits.astype(np.int64)
+    seconds[:] = (
+        (digits[:, 0] * 10 + digits[:, 1]) * 3600
+        + (digits[:, 2] * 10 + digits[:, 3]) * 60
+        + digits[:, 4] * 10 + digits[:, 5]
+    )
+    return seconds, parsed
+
+
+def _parse_general_hms(flat):
+    # Any other "H:M:S" spelling with unsigned integer fields, e.g. "1:05:00" or "100:00:00"
+    text = pd.Series(flat, dtype=object)
+    parts = text.where(text.map(type) == str).str.split(":", expand=True).reindex(columns=range(4))
+    fields = parts.iloc[:, :3].apply(lambda col: col.astype(str).str.strip()).apply(
+        lambda col: pd.to_numeric(col.where(col.str.fullmatch(r"\d+"))))
+    malformed = fields.isna().any(axis=1) | parts[3].notna()
+    seconds = fields[0] * 3600 + fields[1] * 60 + fields[2]
+    return seconds.where(~malformed).to_numpy(dtype=float), malformed.to_numpy()
+
+
 def load_physical_data(csv_path):
     df = pd.read_csv(csv_path)
     df["testDate"] = pd.to_datetime(df["testDate"], format="%d/%m/%Y")
-    return df
+    return normalise_player_ids(df)
 
 
 def load_recovery_data(csv_path):
+    return pivot_recovery(read_recovery_sessions(csv_path))
+
+
+def read_recovery_sessions(csv_path):
+    # Long format: one (sessionDate, metric, value) row per observation
     df = pd.read_csv(csv_path)
     df["sessionDate"] = pd.to_datetime(df["sessionDate"], format="%d/%m/%Y")
+    return normalise_player_ids(df)
 
-    df = pd.read_csv("DATA/CFC Recovery status Data.csv")
-    df["sessionDate"] = pd.to_datetime(df["sessionDate"], format="%d/%m/%Y")
 
-    # Pivot so each metric becomes a column, but keep sessionDate as a column
-    pivoted = df.pivot_table(index="sessionDate", columns="metric", values="value").reset_index().rename(columns={"sessionDate": "date"})
+def pivot_recovery(df):
+    # Pivot so each metric becomes a column, but keep sessionDate (and the player, if any) as columns
+    index = [PLAYER_COL, "sessionDate"] if PLAYER_COL in df.columns else "sessionDate"
+    pivoted = df.pivot_table(index=index, columns="metric", values="value").reset_index().rename(columns={"sessionDate": "date"})
 
     return pivoted
 
 
-def compute_gradient_df(df, metrics=None, max_segments=30):
-    import numpy as np
-
-    gradient_data = []
-
-    # Get max and min for scaling
-    max_vals = {m: df[m].max() for m in metrics}
-    min_vals = {m: df[m].min() for m in metrics}
-
-    for _, row in df.iterrows():
-        date = row["date"]
-        for metric in metrics:
-            total = pd.to_numeric(row[metric], errors="coerce")
-            max_val = pd.to_numeric(max_vals[metric], errors="coerce")
-            min_val = pd.to_numeric(min_vals[metric], errors="coerce")
-
-            if pd.isna(total) or not np.isfinite(total):
-                continue
-
-            if total >= 0 and max_val > 0:
-                # Positive values (e.g. 0 → +1)
-                target_segment_height = max_val / max_segments
-                full_segments = int(total // target_segment_height)
-                remainder = total % target_segment_height
-
-                for i in range(full_segments):
-                    y0 = i * target_segment_height
-                    y1 = y0 + target_segment_height
-                    gradient_data.append({
-                        "date": date,
-                        "metric": metric,
-                        "base": y0,
-                        "height": target_segment_height,
-                        "color_val": y1 / max_val,
-                        "total": total,
-                        "color_scale": "Blues"
-                    })
-
-                if remainder > 0:
-                    y0 = full_segments * target_segment_height
-                    y1 = y0 + remainder
-                    gradient_data.append({
-                        "date": date,
-                        "metric": metric,
-                        "base": y0,
-                        "height": remainder,
-                        "color_val": y1 / max_val,
-                        "total": total,
-                        "color_scale": "Blues"
-                    })
-
-            elif total < 0 and min_val < 0:
-                # Negative values (e.g. 0 → -1)
-                target_segment_height = abs(min_val) / max_segments
-                full_segments = int(abs(total) // target_segment_height)
-                remainder = abs(total) % target_segment_height
-
-                for i in range(full_segments):
-                    y0 = -(i * target_segment_height)
-                    y1 = y0 - target_segment_height
-                    gradient_data.append({
-                        "date": date,
-                        "metric": metric,
-                        "base": y0,
-                        "height": -target_segment_height,
-                        "color_val": abs(y1) / abs(min_val),
-                        "total": total,
-                        "color_scale": "Oranges"
-                    })
-
-                if remainder > 0:
-                    y0 = -(full_segments * target_segment_height)
-                    y1 = y0 - remainder
-                    gradient_data.append({
-                        "date": date,
-                        "metric": metric,
-                        "base": y0,
-                        "height": -remainder,
-                        "color_val": abs(y1) / abs(min_val),
-                        "total": total,
-                        "color_scale": "Oranges"
-                    })
-
-    return pd.DataFrame(gradient_data)
-
-def compute_physical_gradient_df(df, max_segments=30):
-    """
-    Compute a gradient bar chart DataFrame from physical development data.
+def merge_wide_rows(df, rows, date_col="date"):
+    """
+    Merge new wide-format rows into a frame with one row per (player, date).
+
+    Cells present in `rows` overwrite the matching cells of `df`; missing
+    (NaN) cells keep their current value, so a session can arrive in several
+    parts. New dates and metric columns are added. The result is sorted like
+    pivot_recovery output - by key, with the metric columns in name order - so
+    merging a day's sessions matches re-pivoting the whole file with them
+    (as long as no (date, metric) cell is reported twice).
+    """
+    keys = [PLAYER_COL, date_col] if PLAYER_COL in df.columns else [date_col]
+    merged = rows.set_index(keys).combine_first(df.set_index(keys))
+    values = sorted(col for col in merged.columns if col not in keys)
+    return merged.sort_index()[values].reset_index().rename_axis(columns=df.columns.name)
+
+
+def gradient_segments(totals, max_vals, min_vals, max_segments=30):
+    """
+    Split bar totals into equal-height gradient segments in one vectorised pass.
+
+    Positive totals are stacked upwards in steps of max_val / max_segments and
+    negative totals downwards in steps of |min_val| / max_segments; the last
+    segment of a bar holds the remainder. ``max_vals`` and ``min_vals`` are
+    broadcast against ``totals`` so per-bar scales are supported.
 
     Parameters:
-        df (pd.DataFrame): DataFrame with columns ['testDate', 'expression', 'movement', 'quality', 'benchmarkPct']
-        max_segments (int): Number of gradient segments per bar
+        totals (array-like): Bar totals (NaN/inf bars produce no segments)
+        max_vals (array-like or float): Positive scale for each bar
+        min_vals (array-like or float): Negative scale for each bar
+        max_segments (int): Number of full segments in the tallest bar
 
     Returns:
-        pd.DataFrame: Gradient bar segments
+        tuple: (owner, base, height, color_val, positive) arrays with one entry
+        per segment, where owner is the index of the bar the segment belongs to
     """
-    # Drop NaNs and create a composite metric name
-    df_clean = df.dropna(subset=["benchmarkPct"]).copy()
-    df_clean["metric"] = df_clean.apply(
-        lambda row: f"{row['expression']}_{row['movement']}_{row['quality']}".lower().replace(" ", "_"), axis=1
+    totals, max_vals, min_vals = (
+        np.ravel(a) for a in np.broadcast_arrays(
+            np.asarray(totals, dtype=float),
+            np.asarray(max_vals, dtype=float),
+            np.asarray(min_vals, dtype=float)
+        )
+    )
+
+    finite = np.isfinite(totals)
+    with np.errstate(invalid="ignore"):
+        positive = finite & (totals >= 0) & (max_vals > 0)
+        negative = finite & (totals < 0) & (min_vals < 0)
+    drawn = positive | negative
+
+    scale = np.where(positive, max_vals, np.abs(min_vals))
+    magnitude = np.abs(totals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        step = scale / max_segments
+        full = np.where(drawn, np.floor_divide(magnitude, step), 0)
+        remainder = np.where(drawn, np.mod(magnitude, step), 0)
+    full = full.astype(np.int64)
+    counts = full + (remainder > 0)
+
+    owner = np.repeat(np.arange(totals.size), counts)
+    starts = np.cumsum(counts) - counts
+    index = np.arange(owner.size) - starts[owner]
+
+    seg_step = step[owner]
+    is_remainder = index == full[owner]
+    seg_height = np.where(is_remainder, remainder[owner], seg_step)
+    seg_positive = positive[owner]
+
+    # Same operation order as the stacked loop so results match bit-for-bit
+    y0 = index * seg_step
+    base = np.where(seg_positive, y0, -y0)
+    height = np.where(seg_positive, seg_height, -seg_height)
+    top = np.where(seg_positive, base + seg_height, base - seg_height)
+    color_val = np.abs(top) / scale[owner]
+
+    return owner, base, height, color_val, seg_positive
+
+
+def compute_gradient_df(df, metrics=None, max_segments=30):
+    # Scale every metric against its full-history range
+    values = np.column_stack([pd.to_numeric(df[m], errors="coerce").to_numpy(dtype=float) for m in metrics])
+    max_vals = np.array([pd.to_numeric(df[m].max(), errors="coerce") for m in metrics], dtype=float)
+    min_vals = np.array([pd.to_numeric(df[m].min(), errors="coerce") for m in metrics], dtype=float)
+
+    # Row-major flattening keeps the (row, metric, segment) output order
+    owner, base, height, color_val, positive = gradient_segments(
+        values, max_vals, min_vals, max_segments
     )
+    if owner.size == 0:
+        return pd.DataFrame()
+
+    rows, cols = np.divmod(owner, len(metrics))
+    totals = values.ravel()[owner]
+    if all(pd.api.types.is_integer_dtype(df[m]) for m in metrics):
+        totals = totals.astype(np.int64)
+
+    return pd.DataFrame({
+        "date": df["date"].to_numpy()[rows],
+        "metric": np.asarray(metrics, dtype=object)[cols],
+        "base": base,
+        "height": height,
+        "color_val": color_val,
+        "total": totals,
+        "color_scale": np.array(["Oranges", "Blues"], dtype=object)[positive.astype(np.intp)]
+    })
+
+PHYSICAL_KEY_COLS = ["expression", "movement", "quality"]
+
+
+def physical_metric_key(expression, movement, quality):
+    """Composite metric name of one physical test, e.g. "isometric_agility_acceleration"."""
+    return f"{expression}_{movement}_{quality}".lower().replace(" ", "_")
+
+
+def physical_metric_frame(df):
+    """
+    Drop untested rows from the physical data and add a composite metric name
+    (e.g. "isometric_agility_acceleration") alongside a "date" column.
+    """
+    df_clean = df.dropna(subset=["benchmarkPct"]).copy()
+    if df_clean.empty:
+        df_clean["metric"] = pd.Series(dtype=object)
+    else:
+        # Build each distinct (expression, movement, quality) key once and broadcast it by code
+        codes, combos = pd.MultiIndex.from_frame(df_clean[PHYSICAL_KEY_COLS].astype(str)).factorize()
+        keys = np.array([physical_metric_key(*combo) for combo in combos], dtype=object)
+        df_clean["metric"] = keys[codes]
     df_clean.rename(columns={"testDate": "date"}, inplace=True)
+    return df_clean
+
+
+class GradientSegmenter:
+    """
+    Gradient bar segments for one metric over one date window, built on demand.
+
+    Bars are scaled against each metric's full-history range, so a window's
+    segments are identical to the matching rows of compute_gradient_df. Each
+    metric's segments are computed the first time it is drawn and stored as
+    date-sorted columnar arrays with per-bar offset ranges, so fetching a metric
+    is a dictionary lookup and a window is two binary searches plus a slice.
+    Recently drawn windows are kept in a small LRU cache. New or corrected bars
+    can be merged in with update(), which segments only those bars.
+    """
+
+    def __init__(self, blocks, max_segments=30, cache_size=32):
+        # blocks: {metric: (dates, totals)} with matching 1-D arrays
+        self.max_segments = max_segments
+        self.cache_size = cache_size
+        self._blocks = {}
+        self._scales = {}
+        for metric, (dates, totals) in blocks.items():
+            dates = np.asarray(dates, dtype="datetime64[ns]")
+            totals = np.asarray(totals, dtype=float)
+            # Date-sorted blocks so a window is two binary searches
+            order = np.argsort(dates, kind="stable")
+            self._blocks[metric] = (dates[order], totals[order])
+            finite = totals[np.isfinite(totals)]
+            self._scales[metric] = (finite.max(), finite.min()) if finite.size else (np.nan, np.nan)
+        self._segments = {}
+        self._cache = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_wide(cls, df, metrics, date_col="date", **kwargs):
+        """One metric per column, e.g. the GPS or pivoted recovery frames."""
+        dates = df[date_col].to_numpy()
+        return cls({m: (dates, pd.to_numeric(df[m], errors="coerce").to_numpy(dtype=float)) for m in metrics}, **kwargs)
+
+    @classmethod
+    def from_long(cls, df, metric_col="metric", value_col="value", date_col="date", **kwargs):
+        """One row per (date, metric) observation, e.g. physical_metric_frame output."""
+        return cls({
+            metric: (group[date_col].to_numpy(), group[value_col].to_numpy(dtype=float))
+            for metric, group in df.groupby(metric_col, sort=False)
+        }, **kwargs)
+
+    @property
+    def metrics(self):
+        return list(self._blocks)
+
+    def update(self, blocks):
+        """
+        Merge new or corrected bars, {metric: (dates, totals)}, into the segmenter.
+
+        A bar on an existing date replaces it. Already segmented metrics keep
+        the segments of every other bar and only the given bars are segmented,
+        unless the update moves the metric's full-history range - then every
+        bar's scale changes and the metric is re-segmented when next drawn.
+        """
+        with self._lock:
+            for metric, (dates, totals) in blocks.items():
+                dates = np.asarray(dates, dtype="datetime64[ns]")
+                totals = np.asarray(totals, dtype=float)
+                if metric not in self._blocks:
+                    self._blocks[metric] = (dates[:0], totals[:0])
+                    self._scales[metric] = (np.nan, np.nan)
+                self._update_metric(metric, dates, totals)
+            self._cache.clear()
+            self._generation += 1
+
+    def update_wide(self, df, metrics, date_col="date"):
+        """update() from wide-format rows, e.g. the sessions just merged with merge_wide_rows."""
+        dates = df[date_col].to_numpy()
+        self.update({m: (dates, pd.to_numeric(df[m], errors="coerce").to_numpy(dtype=float)) for m in metrics if m in df.columns})
+
+    def _update_metric(self, metric, new_dates, new_totals):
+        # Called with the lock held; new_dates are unique
+        old_dates, old_totals = self._blocks[metric]
+        keep = ~np.isin(old_dates, new_dates)
+        dates = np.concatenate([old_dates[keep], new_dates])
+        totals = np.concatenate([old_totals[keep], new_totals])
+        order = np.argsort(dates, kind="stable")
+        self._blocks[metric] = (dates[order], totals[order])
+
+        finite = totals[np.isfinite(totals)]
+        scales = (finite.max(), finite.min()) if finite.size else (np.nan, np.nan)
+        old_block = self._segments.pop(metric, None)
+        if old_block is None or not np.array_equal(scales, self._scales[metric], equal_nan=True):
+            self._scales[metric] = scales
+            return
+
+        # Splice the new bars' segments between the kept ones: every segment is
+        # keyed by its bar's merged position and stably sorted into place
+        position = np.empty(order.size, dtype=np.intp)
+        position[order] = np.arange(order.size)
+        old_counts = np.diff(old_block["offsets"])
+        kept_segments = np.repeat(keep, old_counts)
+
+        max_val, min_val = scales
+        owner, base, height, color_val, positive = gradient_segments(new_totals, max_val, min_val, self.max_segments)
+        new_counts = np.bincount(owner, minlength=new_totals.size)
+        seg_position = np.concatenate([
+            np.repeat(position[:keep.sum()], old_counts[keep]),
+            position[keep.sum():][owner],
+        ])
+        seg_order = np.argsort(seg_position, kind="stable")
+
+        def splice(old, new):
+            return np.concatenate([old[kept_segments], new])[seg_order]
+
+        counts = np.concatenate([old_counts[keep], new_counts])[order]
+        self._segments[metric] = {
+            "bar_dates": self._blocks[metric][0],
+            "offsets": np.concatenate([[0], np.cumsum(counts)]),
+            "date": splice(old_block["date"], new_dates[owner]),
+            "base": splice(old_block["base"], base),
+            "height": splice(old_block["height"], height),
+            "color_val": splice(old_block["color_val"], color_val),
+            "total": splice(old_block["total"], new_totals[owner]),
+            "positive": splice(old_block["positive"], positive),
+        }
+
+    def segments(self, metric, start=None, end=None):
+        """Return the gradient segments of `metric` for bars dated within [start, end]."""
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        key = (metric, start, end)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            generation = self._generation
+
+        result = self._build(metric, start, end)
+
+        with self._lock:
+            # A window built across an update() may mix old and new bars
+            if generation == self._generation:
+                self._cache[key] = result
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def bars(self, metric, start=None, end=None):
+        """
+        One row per drawn bar of `metric` within [start, end] - its date and
+        total - for figures that render the gradient client-side. The metric's
+        full-history scales are in attrs["max_val"] and attrs["min_val"], so the
+        gradient keeps the colours of the segment bars whatever the window.
+        """
+        if metric not in self._blocks:
+            frame = pd.DataFrame({"date": pd.Series(dtype="datetime64[ns]"), "total": pd.Series(dtype=float)})
+            frame.attrs["metric"] = metric
+            return frame
+
+        with self._lock:
+            dates, totals = self._blocks[metric]
+            max_val, min_val = self._scales[metric]
+        lo = np.searchsorted(dates, pd.Timestamp(start).to_datetime64(), side="left") if start is not None else 0
+        hi = np.searchsorted(dates, pd.Timestamp(end).to_datetime64(), side="right") if end is not None else len(dates)
+        dates, totals = dates[lo:hi], totals[lo:hi]
+
+        # Same bars as gradient_segments draws
+        with np.errstate(invalid="ignore"):
+            drawn = np.isfinite(totals) & (((totals > 0) & (max_val > 0)) | ((totals < 0) & (min_val < 0)))
+        frame = pd.DataFrame({"date": dates[drawn], "total": totals[drawn]})
+        frame.attrs.update(metric=metric, max_val=float(max_val), min_val=float(min_val))
+        return frame
+
+    def _metric_segments(self, metric):
+        # Full-history segment columns for one metric, plus each bar's [offset, next offset) range
+        with self._lock:
+            if metric in self._segments:
+                return self._segments[metric]
+            bars = self._blocks[metric]
+            dates, totals = bars
+            max_val, min_val = self._scales[metric]
+
+        owner, base, height, color_val, positive = gradient_segments(totals, max_val, min_val, self.max_segments)
+        block = {
+            "bar_dates": dates,
+            "offsets": np.concatenate([[0], np.cumsum(np.bincount(owner, minlength=len(dates)))]),
+            "date": dates[owner],
+            "base": base,
+            "height": height,
+            "color_val": color_val,
+            "total": totals[owner],
+            "positive": positive,
+        }
+
+        with self._lock:
+            # Only keep the block if no update() replaced the bars meanwhile
+            if self._blocks.get(metric) is bars:
+                return self._segments.setdefault(metric, block)
+            return block
+
+    def _build(self, metric, start, end):
+        if metric not in self._blocks:
+            frame = pd.DataFrame(columns=["date", "metric", "base", "height", "color_val", "total", "color_scale"])
+            frame.attrs["metric"] = metric
+            return frame
+
+        block = self._metric_segments(metric)
+        dates = block["bar_dates"]
+        lo = np.searchsorted(dates, start.to_datetime64(), side="left") if start is not None else 0
+        hi = np.searchsorted(dates, end.to_datetime64(), side="right") if end is not None else len(dates)
+        window = slice(block["offsets"][lo], block["offsets"][hi])
+
+        frame = pd.DataFrame({
+            "date": block["date"][window],
+            "metric": np.full(window.stop - window.start, metric, dtype=object),
+            "base": block["base"][window],
+            "height": block["height"][window],
+            "color_val": block["color_val"][window],
+            "total": block["total"][window],
+            "color_scale": np.array(["Oranges", "Blues"], dtype=object)[block["positive"][window].astype(np.intp)]
+        })
+        # Lets base_bar_figure skip its metric filter
+        frame.attrs["metric"] = metric
+        return frame
+
+
+class WindowAggregates:
+    """
+    Running totals of several columns over date-sorted rows, so the total of any
+    date window is two binary searches and a subtraction.
+
+    Rows may share a date, so squad-wide frames work as well as one player's
+    sessions. NaN values count as zero, as in pandas' sum(); integer and boolean
+    columns are summed exactly in int64.
+    """
+
+    def __init__(self, dates, columns):
+        # columns: {name: 1-D values aligned with dates}
+        dates = np.asarray(dates, dtype="datetime64[ns]")
+        order = np.argsort(dates, kind="stable")
+        self.dates = dates[order]
+        self._cumulative = {}
+        for name, values in columns.items():
+            values = np.asarray(values)[order]
+            if values.dtype.kind in "biu":
+                values = values.astype(np.int64)
+            else:
+                values = np.nan_to_num(values.astype(float), nan=0.0)
+            self._cumulative[name] = np.concatenate([np.zeros(1, dtype=values.dtype), np.cumsum(values)])
+
+    @property
+    def columns(self):
+        return list(self._cumulative)
+
+    def window(self, start=None, end=None):
+        """Return {column: total} over the rows dated within [start, end]."""
+        lo = np.searchsorted(self.dates, pd.Timestamp(start).to_datetime64(), side="left") if start is not None else 0
+        hi = np.searchsorted(self.dates, pd.Timestamp(end).to_datetime64(), side="right") if end is not None else len(self.dates)
+        hi = max(hi, lo)
+        return {name: cumulative[hi] - cumulative[lo] for name, cumulative in self._cumulative.items()}
 
-    max_values = df_clean.groupby("metric")["benchmarkPct"].max().to_dict()
-
-    gradient_data = []
-
-    for _, row in df_clean.iterrows():
-        metric = row["metric"]
-        total = row["benchmarkPct"]
-        date = row["date"]
-        max_val = max_values.get(metric, np.nan)
-
-        if pd.isna(total) or not np.isfinite(total) or not np.isfinite(max_val) or max_val == 0:
-            continue
-
-        target_segment_height = max_val / max_segments
-        full_segments = int(total // target_segment_height)
-        remainder = total % target_segment_height
-
-        for i in range(full_segments):
-            y0 = i * target_segment_height
-            y1 = y0 + target_segment_height
-            color_val = y1 / max_val
-            gradient_data.append({
-                "date": date,
-                "metric": metric,
-                "base": y0,
-                "height": target_segment_height,
-                "color_val": color_val,
-                "total": total
-            })
-
-        if remainder > 0:
-            y0 = full_segments * target_segment_height
-            y1 = y0 + remainder
-            color_val = y1 / max_val
-            gradient_data.append({
-                "date": date,
-                "metric": metric,
-                "base": y0,
-                "height": remainder,
-                "color_val": color_val,
-                "total": total
-            })
-
-    return pd.DataFrame(gradient_data)
 
 # ACWR calculation
-def compute_acwr(df, metric):
-    df = df.sort_values("date")
-    acwr = []
-    for i in range(len(df)):
-        acute = df.iloc[max(0, i - 6):i + 1][metric].mean()
-        chronic = df.iloc[max(0, i - 27):i + 1][metric].mean()
-        acwr.append(acute / chronic if chronic else 0)
-    df = df.copy()
-    df["acwr"] = acwr
-    return df
\ No newline at end of file
+ACWR_METHODS = {
+    "rolling": ("rolling", False),
+    "rolling_calendar": ("rolling", True),
+    "ewma": ("ewma", False),
+    "ewma_calendar": ("ewma", True),
+}
+
+
+def compute_acwr_table(df, metrics, method="rolling", acute=7, chronic=28):
+    """
+    Compute the acute:chronic workload ratio for several metrics in one pass.
+
+    Parameters:
+        df (pd.DataFrame): Session data with a "date" column and the metric columns
+        metrics (list): Metric columns to compute the ratio for
+        method (str): One of ACWR_METHODS. "rolling" averages the last `acute` and
+            `chronic` sessions, "ewma" uses exponentially weighted averages with
+            spans of `acute` and `chronic`. The "_calendar" variants measure both
+            windows in calendar days instead of sessions.
+        acute (int): Acute window length
+        chronic (int): Chronic window length
+
+    Returns:
+        pd.DataFrame: Date-sorted "date" column plus one ACWR column per metric
+    """
+    kind, calendar = ACWR_METHODS[method]
+    df = df.sort_values("date", kind="stable")
+    dates = df["date"].to_numpy()
+    loads = df[metrics].apply(pd.to_numeric, errors="coerce").set_axis(pd.DatetimeIndex(dates))
+
+    if kind == "rolling":
+        window = (lambda n: f"{n}D") if calendar else (lambda n: n)
+        acute_load = loads.rolling(window(acute), min_periods=1).mean()
+        chronic_load = loads.rolling(window(chronic), min_periods=1).mean()
+    elif calendar:
+        # Convert each span to the half-life (in days) with the same decay per step
+        halflife = lambda n: pd.Timedelta(days=np.log(0.5) / np.log(1 - 2 / (n + 1)))
+        acute_load = loads.ewm(halflife=halflife(acute), times=loads.index).mean()
+        chronic_load = loads.ewm(halflife=halflife(chronic), times=loads.index).mean()
+    else:
+        acute_load = loads.ewm(span=acute).mean()
+        chronic_load = loads.ewm(span=chronic).mean()
+
+    ratio = acute_load / chronic_load.where(chronic_load != 0)
+    ratio = ratio.mask(chronic_load == 0, 0)
+
+    return pd.concat([pd.DataFrame({"date": dates}), ratio.reset_index(drop=True)], axis=1)
+
+
+def compute_acwr(df, metric, method="rolling"):
+    df = df.sort_values("date", kind="stable").copy()
+    df["acwr"] = compute_acwr_table(df, [metric], method)[metric].to_numpy()
+    return df
+
+
+class ACWRCache:
+    """
+    ACWR series for a fixed set of metrics. Each method is computed for every
+    metric in a single pass the first time it is requested, and reused until
+    the source data is replaced with update().
+    """
+
+    def __init__(self, df, metrics):
+        self.metrics = list(metrics)
+        self._lock = threading.Lock()
+        self.update(df)
+
+    def update(self, df):
+        with self._lock:
+            self._df = df
+            self._tables = {}
+            self._series = {}
+
+    def get(self, metric, method="rolling"):
+        """Return a frame with "date" and "acwr" columns for (metric, method)."""
+        key = (metric, method)
+        with self._lock:
+            if key not in self._series:
+                if method not in self._tables:
+                    self._tables[method] = compute_acwr_table(self._df, self.metrics, method)
+                table = self._tables[method]
+                self._series[key] = table[["date", metric]].rename(columns={metric: "acwr"})
+            return self._series[key]
@@ -0,0 +1,248 @@
+"""
+Process-wide registry of the dashboard datasets.
+
+Every dataset is parsed once, on first use, and shared by all pages. Callers
+receive read-only views: DataFrames are shallow copies when pandas
+copy-on-write is enabled (app.py turns it on at startup) and deep copies
+otherwise, so writes to a view never reach the shared frame, and JSON
+documents are frozen into mappings and tuples. Objects derived from a dataset
+(gradient segmenters, lookups, ...) can be memoised with derived() and are
+rebuilt automatically when the dataset is reloaded.
+
+Set CFC_DATA_CACHE_DIR (or call enable_disk_cache()) to keep the preprocessed
+frames in a columnar on-disk cache between process starts, see utils.data_cache.
+
+New sessions can be merged into a loaded dataset with append(), which only
+touches the players they belong to, e.g. a morning's wellness sessions:
+
+    data_registry.append("recovery", pivot_recovery(read_recovery_sessions(path)))
+"""
+import os
+import threading
+import time
+from types import MappingProxyType
+
+import pandas as pd
+
+from utils import data_cache
+from utils.data_loader import (
+    load_json, load_gps_data, load_physical_data, load_recovery_data, build_player_lookup, RadarStats,
+    partition_by_player, with_date_index, merge_wide_rows, PLAYER_COL
+)
+
+DATASETS = {
+    "gps": (load_gps_data, "DATA/CFC GPS Data.csv"),
+    "physical": (load_physical_data, "DATA/CFC Physical Capability Data_.csv"),
+    "recovery": (load_recovery_data, "DATA/CFC Recovery status Data.csv"),
+    "priority_areas": (pd.read_csv, "DATA/CFC Individual Priority Areas.csv"),
+    "players": (load_json, "DATA/players.json"),
+    "fixtures": (load_json, "DATA/fixtures.json"),
+}
+
+# Date column of each per-session dataset, used to partition it by player
+DATE_COLUMNS = {"gps": "date", "physical": "testDate", "recovery": "date"}
+
+# Loaders whose output is worth keeping in the on-disk cache
+CACHEABLE_LOADERS = {load_gps_data, load_physical_data, load_recovery_data}
+
+# How append() merges new rows into each dataset that supports it
+MERGERS = {"recovery": merge_wide_rows}
+
+_data = {}
+_versions = {}
+_revisions = {}
+_derived = {}
+_updaters = {}
+_timings = {}
+_lock = threading.RLock()
+_cache_dir = os.environ.get("CFC_DATA_CACHE_DIR") or None
+
+
+def _freeze(obj):
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _view(obj):
+    if not isinstance(obj, pd.DataFrame):
+        return obj
+    # A shallow copy only isolates writes under copy-on-write
+    return obj.copy(deep=not pd.get_option("mode.copy_on_write"))
+
+
+def _load(name):
+    loader, path = DATASETS[name]
+    start = time.perf_counter()
+    if _cache_dir and loader in CACHEABLE_LOADERS:
+        data, source = data_cache.cached_load(name, loader, path, _cache_dir)
+    else:
+        data, source = loader(path), "source"
+    _data[name] = data if isinstance(data, pd.DataFrame) else _freeze(data)
+    _versions[name] = _versions.get(name, 0) + 1
+    for key in [k for k in _revisions if k[0] == name]:
+        del _revisions[key]
+    _timings[name] = {"path": path, "source": source, "seconds": time.perf_counter() - start}
+    for key in [k for k in _derived if k[0] == name]:
+        del _derived[key]
+
+
+def enable_disk_cache(cache_dir):
+    """Cache preprocessed frames under `cache_dir` (None disables). Affects later loads only."""
+    global _cache_dir
+    with _lock:
+        _cache_dir = cache_dir
+
+
+def get(name):
+    """Return a read-only view of dataset `name`, loading it on first use."""
+    with _lock:
+        if name not in _data:
+            _load(name)
+        return _view(_data[name])
+
+
+def reload(name):
+    """Re-read dataset `name` from its source and drop everything derived from it."""
+    with _lock:
+        _load(name)
+        return _view(_data[name])
+
+
+def append(name, rows):
+    """
+    Merge new rows, in the format of dataset `name`, into the loaded dataset.
+
+    Only the players the rows belong to are affected: their partitions are
+    merged, objects built for them with player_derived() are updated in place
+    where an update function was registered (and dropped otherwise), and their
+    player_token() changes. Objects derived from the whole dataset are dropped.
+    Appended rows are kept in memory only; the source file is not modified.
+    """
+    merge = MERGERS[name]
+    date_col = DATE_COLUMNS[name]
+    with _lock:
+        get(name)
+        partitions = _player_partitions(name)
+        _data[name] = merge(_data[name], rows, date_col)
+
+        if None in partitions:
+            groups = {None: rows}
+        else:
+            groups = {str(pid): group for pid, group in rows.groupby(PLAYER_COL, sort=False)}
+        for player_key, player_rows in groups.items():
+            current = partitions.get(player_key, _data[name].iloc[:0])
+            merged = with_date_index(merge(current, player_rows, date_col), date_col)
+            partitions[player_key] = merged
+            _revisions[(name, player_key)] = _revisions.get((name, player_key), 0) + 1
+            changed = merged[merged[date_col].isin(player_rows[date_col])]
+
+            for cache_key in [k for k in _derived if k[0] == name and isinstance(k[1], tuple) and k[1][1] == player_key]:
+                update = _updaters.get((name, cache_key[1][0]))
+                if update is None:
+                    del _derived[cache_key]
+                else:
+                    update(_derived[cache_key], _view(changed))
+
+        for cache_key in [k for k in _derived if k[0] == name and not isinstance(k[1], tuple)]:
+            if cache_key[1] != "player_partitions":
+                del _derived[cache_key]
+        return _view(_data[name])
+
+
+def version(name):
+    """Number of times dataset `name` has been loaded (0 if never)."""
+    with _lock:
+        return _versions.get(name, 0)
+
+
+def derived(name, key, builder):
+    """
+    Return builder(get(name)), computed once per version of dataset `name`.
+
+    Use this for anything expensive that depends only on one dataset so every
+    page shares the same instance.
+    """
+    with _lock:
+        data = get(name)
+        cache_key = (name, key)
+        if cache_key not in _derived:
+            start = time.perf_counter()
+            _derived[cache_key] = builder(data)
+            _timings[f"{name}:{key}"] = {"path": None, "source": "derived", "seconds": time.perf_counter() - start}
+        return _derived[cache_key]
+
+
+def _player_partitions(name):
+    return derived(name, "player_partitions", lambda df: partition_by_player(df, DATE_COLUMNS[name]))
+
+
+def _player_key(partitions, player_id):
+    # Single-athlete exports (partition None) apply to every player
+    return None if None in partitions else str(player_id)
+
+
+def player_frame(name, player_id):
+    """
+    Return a read-only, date-sorted view of one player's rows of dataset `name`.
+
+    Squad-wide exports are partitioned by player once per dataset version, so
+    this is a dictionary lookup. Players without data get an empty frame.
+    """
+    with _lock:
+        partitions = _player_partitions(name)
+        frame = partitions.get(_player_key(partitions, player_id))
+        if frame is None:
+            frame = _data[name].iloc[:0]
+        return _view(frame)
+
+
+def player_token(name, player_id):
+    """
+    Hashable (name, version, partition, revision) token identifying the data a
+    player's views of dataset `name` are built from. Players that share a
+    partition (a single-athlete export) share a token; append() bumps the
+    revision of the partitions it changes.
+    """
+    with _lock:
+        partitions = _player_partitions(name)
+        player_key = _player_key(partitions, player_id)
+        return name, _versions[name], player_key, _revisions.get((name, player_key), 0)
+
+
+def player_derived(name, player_id, key, builder, update=None):
+    """
+    Like derived(), but builder receives (and the result is cached for) one player's frame.
+
+    If given, update(obj, rows) is called with the player's merged rows on the
+    dates append() touched, instead of rebuilding obj from scratch.
+    """
+    with _lock:
+        if update is not None:
+            _updaters[(name, key)] = update
+        partitions = _player_partitions(name)
+        cache_key = (name, (key, _player_key(partitions, player_id)))
+        if cache_key not in _derived:
+            _derived[cache_key] = builder(player_frame(name, player_id))
+        return _derived[cache_key]
+
+
+def player_lookup():
+    """Every Chelsea and opposition player in players.json, keyed by string id."""
+    return derived("players", "lookup", build_player_lookup)
+
+
+def radar_stats():
+    """Per-position per-90 radar matrices of every player in players.json."""
+    return derived("players", "radar_stats", lambda data: RadarStats(player_lookup()))
+
+
+def load_timings():
+    """
+    Seconds spent loading each dataset (and building each derived object) so far,
+    with where it came from: "source", "cache" or "derived".
+    """
+    with _lock:
+        return {name: dict(timing) for name, timing in _timings.items()}
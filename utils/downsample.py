@@ -0,0 +1,123 @@
+"""
+Downsampling of long time series before they are sent to the browser.
+
+A trace is drawn with at most about `points_per_px` points per pixel of plot
+width. Series within that budget are returned untouched, so the browser can
+re-window them freely. Longer series keep an overview of the whole history at
+the budget plus the visible window at the budget, and are downsampled again
+whenever the window changes.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+# Assumed plot width when the browser does not report one
+PLOT_WIDTH_PX = int(os.environ.get("CFC_PLOT_WIDTH_PX", 1200))
+
+
+def point_budget(width_px=PLOT_WIDTH_PX, points_per_px=2):
+    """Points a trace spanning the plot width is reduced to."""
+    return int(width_px * points_per_px)
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype("datetime64[ns]").astype(np.int64)
+    return values.astype(float)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; the rest are split into
+    n_out - 2 buckets and each keeps the point forming the largest triangle
+    with the previous pick and the next bucket's average.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = _as_float(x)
+    y = _as_float(y)
+    y = np.where(np.isfinite(y), y, 0.0)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    edges = np.append(edges, n)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = edges[i + 1], edges[i + 2]
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y, n_out):
+    """
+    Indices of each bucket's minimum and maximum (in order), about n_out in
+    total - preserves peaks exactly, at the cost of less even spacing than LTTB.
+    """
+    n = len(y)
+    buckets = max(n_out // 2, 1)
+    if n_out >= n or buckets >= n:
+        return np.arange(n)
+
+    y = _as_float(y)
+    y = np.where(np.isfinite(y), y, np.nan)
+    starts = np.linspace(0, n, buckets + 1).astype(np.intp)[:-1]
+    owner = np.repeat(np.arange(buckets), np.diff(np.append(starts, n)))
+
+    filled_low = np.where(np.isnan(y), np.inf, y)
+    filled_high = np.where(np.isnan(y), -np.inf, y)
+    lows = np.minimum.reduceat(filled_low, starts)
+    highs = np.maximum.reduceat(filled_high, starts)
+
+    # First position of each bucket's extreme (all-NaN buckets fall back to their first point)
+    def first_match(filled, extremes):
+        idx = np.flatnonzero(filled == extremes[owner])
+        found, first = np.unique(owner[idx], return_index=True)
+        positions = starts.copy()
+        positions[found] = idx[first]
+        return positions
+
+    first_low = first_match(filled_low, lows)
+    first_high = first_match(filled_high, highs)
+
+    return np.unique(np.concatenate([first_low, first_high, [0, n - 1]]))
+
+
+def downsample_indices(x, y, n_out, method="lttb"):
+    """Row positions to keep so a plot of y against x has about n_out points."""
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    raise ValueError(f"Unknown downsampling method: {method!r}")
+
+
+def window_indices(dates, y, start, end, n_out, method="lttb"):
+    """
+    Row positions to keep of a date-sorted series shown through the window
+    [start, end]: the whole series reduced to n_out points, merged with the
+    window's rows (and their neighbours just outside it) reduced to n_out on
+    their own. At most about 2 * n_out rows are kept, however long the history.
+    """
+    n = len(dates)
+    if n <= n_out:
+        return np.arange(n)
+    dates = pd.DatetimeIndex(dates)
+    lo = max(dates.searchsorted(pd.Timestamp(start), side="left") - 1, 0)
+    hi = min(dates.searchsorted(pd.Timestamp(end), side="right") + 1, n)
+    y = np.asarray(y)
+    overview = downsample_indices(dates, y, n_out, method)
+    window = lo + downsample_indices(dates[lo:hi], y[lo:hi], n_out, method)
+    return np.union1d(overview, window)
@@ -0,0 +1,74 @@
+"""
+Server-side cache of rendered figures shared by every session.
+
+Figure callbacks key their output on a normalised tuple - the figure, the
+data it is drawn from (data_registry.player_token), the metric/dropdown values
+and the slider window - so the same chart requested by several users, or again
+after a tab switch, is built once. Entries are evicted least-recently-used
+once their serialised size exceeds the byte budget.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from plotly.utils import PlotlyJSONEncoder
+
+
+class FigureCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, builder):
+        """Return the cached value for `key`, calling builder() on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        value = builder()
+        size = len(json.dumps(value, cls=PlotlyJSONEncoder))
+        if size > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self._bytes -= evicted_size
+                    self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def window_key(selected_range):
+    # Slider values are whole-second timestamps on a weekly grid
+    return tuple(int(v) for v in selected_range)
+
+
+figure_cache = FigureCache(int(os.environ.get("CFC_FIGURE_CACHE_BYTES", 64 * 1024 * 1024)))
@@ -1,37 +1,50 @@
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from dash import html, dcc
 from utils.constants import colors
 import matplotlib.colors as mcolors
 
-def get_matchday_shapes_annotations(df):
-    matchday_df = df[df["is_match_day"] == True]
-
-    shapes = [{
-        "type": "line",
-        "x0": row["date"],
-        "x1": row["date"],
-        "y0": 0,
-        "y1": 1,
-        "xref": "x",
-        "yref": "paper",
-        "line": {"color": "gray", "width": 1}
-    } for _, row in matchday_df.iterrows()]
-
-    annotations = [{
-        "x": row["date"],
-        "y": 1,
-        "xref": "x",
-        "yref": "paper",
-        "text": row["opposition_code"],
-        "showarrow": False,
-        "textangle": -90,
-        "font": {"color": "gray", "size": 10},
-        "yanchor": "bottom"
-    } for _, row in matchday_df.iterrows()]
-
-    return shapes, annotations
+class MatchdayOverlays:
+    """
+    Match-day lines and opposition labels of a GPS history, built once and
+    sorted by date so each figure only carries the overlays in its window.
+    """
+
+    def __init__(self, df):
+        matchday_df = df[df["is_match_day"] == True].sort_values("date", kind="stable")
+        self.dates = matchday_df["date"].to_numpy(dtype="datetime64[ns]")
+        dates = matchday_df["date"].tolist()
+
+        self.shapes = [{
+            "type": "line",
+            "x0": date,
+            "x1": date,
+            "y0": 0,
+            "y1": 1,
+            "xref": "x",
+            "yref": "paper",
+            "line": {"color": "gray", "width": 1}
+        } for date in dates]
+
+        self.annotations = [{
+            "x": date,
+            "y": 1,
+            "xref": "x",
+            "yref": "paper",
+            "text": code,
+            "showarrow": False,
+            "textangle": -90,
+            "font": {"color": "gray", "size": 10},
+            "yanchor": "bottom"
+        } for date, code in zip(dates, matchday_df["opposition_code"].tolist())]
+
+    def window(self, start=None, end=None):
+        """(shapes, annotations) for match days within [start, end]; None leaves a side open."""
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start).to_datetime64(), side="left")
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end).to_datetime64(), side="right")
+        return self.shapes[lo:hi], self.annotations[lo:hi]
 
 def add_average_lines(fig, match_avg, training_avg, suffix=""):
     fig.add_scatter(
@@ -57,24 +70,7 @@ def add_average_lines(fig, match_avg, training_avg, suffix=""):
 
 import plotly.graph_objects as go
 
-def base_bar_figure(
-    df,
-    metric,
-    x_range,
-    match_avg=None,
-    training_avg=None,
-    hover_suffix="",
-    y_range=[None, None],
-    shapes=None,
-    annotations=None
-):
-    filtered = df[df["metric"] == metric]
-    
-    positive_df = filtered[filtered["total"] >= 0]
-    negative_df = filtered[filtered["total"] < 0]
-
-    fig = go.Figure()
-
+def add_segment_bars(fig, positive_df, negative_df, hover_suffix=""):
     # Positive bars in Blues
     if not positive_df.empty:
         fig.add_trace(go.Bar(
@@ -109,6 +105,87 @@ def base_bar_figure(
             showlegend=False
         ))
 
+
+def add_gradient_fill_bars(fig, bars, hover_suffix=""):
+    """
+    Draw the bars as a filled step outline with a vertical colorscale gradient, plus a
+    transparent bar trace for hover: one date and total per bar instead of a
+    stacked bar per gradient segment. Dates go out as epoch milliseconds.
+
+    The gradient spans 0..max_val upwards and min_val..0 downwards, from the
+    frame's attrs (see GradientSegmenter.bars), so a bar's colour does not
+    depend on the tallest bar in the window.
+    """
+    dates = bars["date"].to_numpy(dtype="datetime64[ms]").astype(np.int64).astype(float)
+    totals = bars["total"].to_numpy(dtype=float)
+
+    # Bars fill the gap to their nearest neighbour (the layout uses bargap=0)
+    gaps = np.diff(np.unique(dates))
+    half_width = (gaps.min() if gaps.size else 86_400_000.0) / 2
+
+    max_val, min_val = bars.attrs.get("max_val"), bars.attrs.get("min_val")
+    for positive, colorscale, name in ((True, "Blues", "Positive"), (False, "Oranges_r", "Negative")):
+        mask = totals >= 0 if positive else totals < 0
+        if not mask.any():
+            continue
+        gradient = dict(type="vertical", colorscale=colorscale)
+        scale = max_val if positive else min_val
+        if scale is not None and np.isfinite(scale) and scale != 0:
+            gradient["start"], gradient["stop"] = sorted((0.0, scale))
+        # Step outline filled to zero: each bar's top from its left edge, back to zero at its right edge
+        x = np.repeat(dates[mask], 2) + np.tile([-half_width, half_width], mask.sum())
+        y = np.repeat(totals[mask], 2) * np.tile([1.0, 0.0], mask.sum())
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=y,
+            mode="lines",
+            line=dict(width=0, shape="hv"),
+            fill="tozeroy",
+            fillgradient=gradient,
+            hoverinfo="skip",
+            name=name,
+            showlegend=False
+        ))
+
+    fig.add_trace(go.Bar(
+        x=dates,
+        y=totals,
+        marker=dict(color="rgba(0,0,0,0)", line=dict(width=0)),
+        hovertemplate=f"%{{y:.2f}}{hover_suffix}<extra></extra>",
+        name="Total",
+        showlegend=False
+    ))
+
+
+def base_bar_figure(
+    df,
+    metric,
+    x_range,
+    match_avg=None,
+    training_avg=None,
+    hover_suffix="",
+    y_range=[None, None],
+    shapes=None,
+    annotations=None,
+    compact=False
+):
+    """
+    Gradient bar chart of one metric. `df` holds GradientSegmenter.segments()
+    rows, or with compact=True one GradientSegmenter.bars() row per bar.
+    """
+    # Frames from GradientSegmenter already hold a single metric
+    filtered = df if df.attrs.get("metric") == metric else df[df["metric"] == metric]
+    
+    positive_df = filtered[filtered["total"] >= 0]
+    negative_df = filtered[filtered["total"] < 0]
+
+    fig = go.Figure()
+
+    if compact:
+        add_gradient_fill_bars(fig, filtered, hover_suffix)
+    else:
+        add_segment_bars(fig, positive_df, negative_df, hover_suffix)
+
     # Add dummy traces for average legends
     if match_avg is not None:
         fig.add_scatter(
@@ -138,8 +215,13 @@ def base_bar_figure(
             "line": {"color": "#ec9706", "width": 1, "dash": "dash"}
         })
 
+    xaxis = dict(title=None, range=x_range, fixedrange=True, showline=True, linecolor='gray')
+    if compact:
+        # Compact traces send dates as epoch milliseconds
+        xaxis["type"] = "date"
+
     fig.update_layout(
-        xaxis=dict(title=None, range=x_range, fixedrange=True, showline=True, linecolor='gray'),
+        xaxis=xaxis,
         yaxis=dict(title=None, fixedrange=True, range=y_range),
         plot_bgcolor="#fff",
         paper_bgcolor="#fff",
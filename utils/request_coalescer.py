@@ -0,0 +1,55 @@
+"""
+Drop callback requests that a newer request from the same client has superseded.
+
+A burst of slider moves queues one request per window for every dependent
+callback. Each request takes a generation number when it starts and waits
+`settle_seconds` (CFC_SLIDER_SETTLE_MS, 100 ms by default) before building. If
+a newer request for the same (client, callback) key has started by then, it
+is dropped with PreventUpdate without building, so a burst builds only its
+final window. A request superseded while building is dropped the same way.
+"""
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from dash.exceptions import PreventUpdate
+
+
+class RequestCoalescer:
+    def __init__(self, settle_seconds=0.0, max_keys=10000):
+        self.settle_seconds = settle_seconds
+        self.max_keys = max_keys
+        self._latest = OrderedDict()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def run(self, key, builder):
+        """Return builder(), or raise PreventUpdate if a newer request for `key` started meanwhile."""
+        with self._lock:
+            generation = self._latest[key] = next(self._counter)
+            self._latest.move_to_end(key)
+            # Forgetting a key only means an older request for it is no longer dropped
+            while len(self._latest) > self.max_keys:
+                self._latest.popitem(last=False)
+
+        if self.settle_seconds:
+            time.sleep(self.settle_seconds)
+        self._check(key, generation)
+
+        result = builder()
+        self._check(key, generation)
+        return result
+
+    def _check(self, key, generation):
+        with self._lock:
+            superseded = self._latest.get(key, generation) != generation
+            if superseded:
+                self.dropped += 1
+        if superseded:
+            raise PreventUpdate
+
+
+coalescer = RequestCoalescer(int(os.environ.get("CFC_SLIDER_SETTLE_MS", 100)) / 1000)